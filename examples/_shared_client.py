@@ -0,0 +1,46 @@
+"""
+Shared client setup for the example scripts.
+
+The client, and with it the gRPC channels to every node, is created once per
+process, so running several examples back to back in the same interpreter
+reuses the same connections instead of opening new ones for every example.
+
+Examples importing this module must be run as modules from the project root:
+
+    uv run -m examples.name_of_module
+    python -m examples.name_of_module
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+from hiero_sdk_python import AccountId, Client, Network, PrivateKey
+
+# Load environment variables from .env file
+load_dotenv()
+
+
+@lru_cache(maxsize=1)
+def get_client():
+    """
+    Return the shared testnet client together with the operator credentials.
+
+    Returns:
+        tuple: (client, operator_id, operator_key)
+    """
+    print("Connecting to Hedera testnet...")
+    client = Client(Network(network='testnet'))
+
+    try:
+        operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
+        operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
+    except (TypeError, ValueError):
+        print("❌ Error: Please check OPERATOR_ID and OPERATOR_KEY in your .env file.")
+        sys.exit(1)
+
+    client.set_operator(operator_id, operator_key)
+    print(f"Using operator account: {operator_id}")
+    return client, operator_id, operator_key
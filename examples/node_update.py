@@ -26,6 +26,9 @@ from hiero_sdk_python.nodes.node_create_transaction import NodeCreateTransaction
 from hiero_sdk_python.nodes.node_update_transaction import NodeUpdateTransaction
 from hiero_sdk_python.response_code import ResponseCode
 
+# Load environment variables from .env file
+load_dotenv()
+
 # Gossip certificate is a DER-encoded x509 certificate used for secure communication between nodes.
 # This certificate authenticates the node's identity during gossip protocol communication.
 # Information about x509 certificates: https://www.ssl.com/faqs/what-is-an-x-509-certificate/
@@ -39,7 +42,6 @@ GOSSIP_CERTIFICATE = "3082052830820310a003020102020101300d06092a864886f70d01010c
 
 def setup_client():
     """Initialize and set up the client with operator account"""
-    load_dotenv()
     network = Network(network="solo")
     client = Client(network)
 
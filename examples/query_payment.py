@@ -53,7 +53,7 @@ def create_fungible_token(client, operator_id, operator_key):
     )
     
     if receipt.status != ResponseCode.SUCCESS:
-        print(f"Fungible token creation failed with status: {ResponseCode.get_name(receipt.status)}")
+        print(f"Fungible token creation failed with status: {ResponseCode(receipt.status).name}")
         sys.exit(1)
     
     token_id = receipt.token_id
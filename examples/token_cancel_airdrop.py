@@ -13,9 +13,11 @@ from hiero_sdk_python import (
     Network,
     PrivateKey,
     AccountCreateTransaction,
+    BatchTransaction,
     Hbar,
     TokenCreateTransaction,
     TokenAirdropTransaction,
+    TransactionGetReceiptQuery,
     TransactionRecordQuery,
     TokenCancelAirdropTransaction,
     ResponseCode
@@ -40,42 +42,58 @@ def setup_client():
         sys.exit(1)
 
 
-def create_account(client, operator_key, initial_balance=Hbar.from_tinybars(100_000_000)):
-    """Create a new account with the given initial balance."""
-    print("\nCreating a new account...")
+def build_account_create(client, operator_key, recipient_key, initial_balance=Hbar.from_tinybars(100_000_000)):
+    """Build a batched account create transaction for the recipient."""
+    return (
+        AccountCreateTransaction()
+        .set_key(recipient_key.public_key())
+        .set_initial_balance(initial_balance)
+        .batchify(client, operator_key.public_key())
+    )
+
+
+def build_token_create(client, operator_id, operator_key, token_name, token_symbol, initial_supply=1):
+    """Build a batched token create transaction."""
+    return (
+        TokenCreateTransaction()
+        .set_token_name(token_name)
+        .set_token_symbol(token_symbol)
+        .set_initial_supply(initial_supply)
+        .set_treasury_account_id(operator_id)
+        .batchify(client, operator_key.public_key())
+    )
+
+
+def create_account_and_tokens(client, operator_id, operator_key):
+    """
+    Create the recipient account and two tokens in a single atomic batch (HIP-551),
+    so the three independent setup steps reach consensus in one round.
+    """
+    print("\nCreating a new account and two tokens in one batch...")
     recipient_key = PrivateKey.generate("ed25519")
     try:
-        tx = (
-            AccountCreateTransaction()
-            .set_key(recipient_key.public_key())
-            .set_initial_balance(initial_balance)
+        batch_tx = (
+            BatchTransaction()
+            .add_inner_transaction(build_account_create(client, operator_key, recipient_key))
+            .add_inner_transaction(build_token_create(client, operator_id, operator_key, "First Token", "TKA"))
+            .add_inner_transaction(build_token_create(client, operator_id, operator_key, "Second Token", "TKB"))
         )
-        receipt = tx.freeze_with(client).sign(operator_key).execute(client)
-        recipient_id = receipt.account_id
-        print(f"Created a new account with ID: {recipient_id}")
-        return recipient_id, recipient_key
-    except Exception as e:
-        print(f"Error creating new account: {e}")
-        sys.exit(1)
+        receipt = batch_tx.freeze_with(client).sign(operator_key).execute(client)
+        if receipt.status != ResponseCode.SUCCESS:
+            print(f"Batch failed with status: {ResponseCode(receipt.status).name}")
+            sys.exit(1)
 
+        # Each inner transaction keeps its own ID and receipt
+        account_tx_id, token_tx_id_1, token_tx_id_2 = batch_tx.get_inner_transaction_ids()
+        recipient_id = TransactionGetReceiptQuery(account_tx_id).execute(client).account_id
+        token_id_1 = TransactionGetReceiptQuery(token_tx_id_1).execute(client).token_id
+        token_id_2 = TransactionGetReceiptQuery(token_tx_id_2).execute(client).token_id
 
-def create_token(client, operator_id, operator_key, token_name, token_symbol, initial_supply=1):
-    """Create a new token and return its token ID."""
-    print(f"\nCreating token: {token_name} ({token_symbol})...")
-    try:
-        tx = (
-            TokenCreateTransaction()
-            .set_token_name(token_name)
-            .set_token_symbol(token_symbol)
-            .set_initial_supply(initial_supply)
-            .set_treasury_account_id(operator_id)
-        )
-        receipt = tx.freeze_with(client).sign(operator_key).execute(client)
-        token_id = receipt.token_id
-        print(f"Created token {token_name} with ID: {token_id}")
-        return token_id
+        print(f"Created a new account with ID: {recipient_id}")
+        print(f"Created tokens with IDs: {token_id_1}, {token_id_2}")
+        return recipient_id, recipient_key, token_id_1, token_id_2
     except Exception as e:
-        print(f"Error creating token {token_name}: {e}")
+        print(f"Error creating account and tokens: {e}")
         sys.exit(1)
 
 
@@ -121,11 +139,9 @@ def cancel_airdrops(client, operator_key, pending_airdrops):
 
 def token_cancel_airdrop():
     client, operator_id, operator_key = setup_client()
-    recipient_id, _ = create_account(client, operator_key)
 
-    # Create two tokens
-    token_id_1 = create_token(client, operator_id, operator_key, "First Token", "TKA")
-    token_id_2 = create_token(client, operator_id, operator_key, "Second Token", "TKB")
+    # Create the recipient account and two tokens
+    recipient_id, _, token_id_1, token_id_2 = create_account_and_tokens(client, operator_id, operator_key)
 
     # Airdrop tokens
     pending_airdrops = airdrop_tokens(client, operator_id, operator_key, recipient_id, [token_id_1, token_id_2])
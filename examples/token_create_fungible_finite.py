@@ -11,63 +11,53 @@ Dependencies:
 - dotenv
 - hiero_sdk_python
 
-uv run examples/token_create_fungible_finite.py
-python examples/token_create_fungible_finite.py
+uv run -m examples.token_create_fungible_finite
+python -m examples.token_create_fungible_finite
 
 """
 # Adapt imports and paths as appropriate
 import os
+import re
 import sys
-from dotenv import load_dotenv
 from hiero_sdk_python import (
-    Client,
-    AccountId,
     PrivateKey,
     TokenCreateTransaction,
-    Network,
 )
-from hiero_sdk_python.tokens.token_type import TokenType
-from hiero_sdk_python.tokens.supply_type import SupplyType
-# Load environment variables from .env file
-load_dotenv()
+
+# Importing the shared client module loads the .env file once for all examples
+from ._shared_client import get_client
+
+# Optional keys are raw 32-byte Ed25519 seeds in hex; placeholders like <ADMIN_KEY> do not match
+_ED25519_KEY_RE = re.compile(r"(0x)?[0-9a-fA-F]{64}")
+
+def parse_optional_key(key_str):
+    """Return the Ed25519 private key for key_str, or None if it is unset or not a raw hex seed."""
+    if not key_str or not _ED25519_KEY_RE.fullmatch(key_str):
+        return None
+    return PrivateKey.from_string_ed25519(key_str)
+
 def create_token_fungible_finite():
     """Function to create a finite fungible token."""
     # Network Setup
-    network = Network(network='testnet')
-    client = Client(network)
-
-    operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-    operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
+    client, operator_id, operator_key = get_client()
 
-    def parse_optional_key(key_str):
-        if not key_str or key_str.startswith('<') or key_str.endswith('>'):
-            return None
-        try:
-            return PrivateKey.from_string_ed25519(key_str)
-        except:
-            return None
-    
     admin_key = parse_optional_key(os.getenv('ADMIN_KEY'))
     supply_key = parse_optional_key(os.getenv('SUPPLY_KEY'))
     freeze_key = parse_optional_key(os.getenv('FREEZE_KEY'))
     pause_key = parse_optional_key(os.getenv('PAUSE_KEY'))
-    # Set the operator for the client
-    client.set_operator(operator_id, operator_key)
     # Create the token creation transaction
-    # In this example, we set up a default empty token create transaction, then set the values
-    transaction = (
-        TokenCreateTransaction()
-        .set_token_name("FiniteFungibleToken")
-        .set_token_symbol("FFT")
-        .set_decimals(2)
-        .set_initial_supply(10)  # TokenType.FUNGIBLE_COMMON must have >0 initial supply. Cannot exceed max supply
-        .set_treasury_account_id(operator_id) # Also known as treasury account
-        .set_token_type(TokenType.FUNGIBLE_COMMON)
-        .set_supply_type(SupplyType.FINITE)
-        .set_max_supply(100)
-        .freeze_with(client) # Freeze the transaction. Returns self so we can sign.
+    # In this example, the factory method sets the name, symbol, decimals, initial supply,
+    # max supply and treasury account, and the optional keys are set afterwards.
+    # Fungible tokens must have >0 initial supply. Cannot exceed max supply
+    transaction = TokenCreateTransaction.for_fungible_finite(
+        "FiniteFungibleToken",
+        "FFT",
+        decimals=2,
+        initial_supply=10,
+        max_supply=100,
+        treasury_account_id=operator_id,
     )
-    
+
     # Add optional keys only if they exist
     if admin_key:
         transaction.set_admin_key(admin_key)
@@ -77,6 +67,8 @@ def create_token_fungible_finite():
         transaction.set_freeze_key(freeze_key)
     if pause_key:
         transaction.set_pause_key(pause_key)
+    # Freeze the transaction once every field is set. Returns self so we can sign.
+    transaction.freeze_with(client)
     # Required signature by treasury (operator)
     transaction.sign(operator_key)
     # Sign with adminKey if provided
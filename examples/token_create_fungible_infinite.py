@@ -1,24 +1,17 @@
 """
-uv run examples/token_create_fungible_infinite.py
-python examples/token_create_fungible_infinite.py
+uv run -m examples.token_create_fungible_infinite
+python -m examples.token_create_fungible_infinite
 
 """
 
-import os
 import sys
-from dotenv import load_dotenv
+
 from hiero_sdk_python import (
-    Client,
-    AccountId,
     PrivateKey,
     TokenCreateTransaction,
-    Network,
-    TokenType,
-    SupplyType,
 )
 
-# Load environment variables from .env file
-load_dotenv()
+from ._shared_client import get_client
 
 
 def create_token_fungible_infinite():
@@ -27,18 +20,7 @@ def create_token_fungible_infinite():
     """
     # 1. Network and Operator Setup
     # =================================================================
-    print("Connecting to Hedera testnet...")
-    network = Network(network='testnet')
-    client = Client(network)
-
-    try:
-        operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-        operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-        client.set_operator(operator_id, operator_key)
-        print(f"Using operator account: {operator_id}")
-    except (TypeError, ValueError):
-        print("❌ Error: Please check OPERATOR_ID and OPERATOR_KEY in your .env file.")
-        sys.exit(1)
+    client, operator_id, operator_key = get_client()
 
     # 2. Generate Keys On-the-Fly
     # =================================================================
@@ -52,15 +34,14 @@ def create_token_fungible_infinite():
     try:
         print("\nBuilding transaction to create an infinite fungible token...")
         transaction = (
-            TokenCreateTransaction()
-            .set_token_name("Infinite Fungible Token")
-            .set_token_symbol("IFT")
-            .set_decimals(2)
-            .set_initial_supply(1000)  # Must have an initial supply > 0
-            .set_treasury_account_id(operator_id)
-            .set_token_type(TokenType.FUNGIBLE_COMMON)
-            .set_supply_type(SupplyType.INFINITE)
-            # For infinite supply, max_supply is not set
+            # The initial supply of a fungible token must be > 0
+            TokenCreateTransaction.for_fungible_infinite(
+                "Infinite Fungible Token",
+                "IFT",
+                decimals=2,
+                initial_supply=1000,
+                treasury_account_id=operator_id,
+            )
             .set_admin_key(admin_key)    # Use the generated admin key
             .set_supply_key(supply_key)  # Use the generated supply key
             .freeze_with(client)
@@ -1,23 +1,16 @@
 """
-uv run examples/token_create_nft_infinite.py
-python examples/token_create_nft_infinite.py
+uv run -m examples.token_create_nft_infinite
+python -m examples.token_create_nft_infinite
 
 """
-import os
 import sys
-from dotenv import load_dotenv
+
 from hiero_sdk_python import (
-    Client,
-    AccountId,
     PrivateKey,
     TokenCreateTransaction,
-    Network,
-    TokenType,
-    SupplyType,
 )
 
-# Load environment variables from .env file
-load_dotenv()
+from ._shared_client import get_client
 
 
 def create_token_nft_infinite():
@@ -26,18 +19,7 @@ def create_token_nft_infinite():
     """
     # 1. Network and Operator Setup
     # =================================================================
-    print("Connecting to Hedera testnet...")
-    network = Network(network='testnet')
-    client = Client(network)
-
-    try:
-        operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-        operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-        client.set_operator(operator_id, operator_key)
-        print(f"Using operator account: {operator_id}")
-    except (TypeError, ValueError):
-        print("❌ Error: Please check OPERATOR_ID and OPERATOR_KEY in your .env file.")
-        sys.exit(1)
+    client, operator_id, operator_key = get_client()
 
     # 2. Generate Keys On-the-Fly
     # =================================================================
@@ -51,13 +33,8 @@ def create_token_nft_infinite():
     try:
         print("\nBuilding transaction to create an infinite NFT...")
         transaction = (
-            TokenCreateTransaction()
-            .set_token_name("InfiniteNFTToken")
-            .set_token_symbol("INFTT")
-            .set_token_type(TokenType.NON_FUNGIBLE_UNIQUE)
-            .set_treasury_account_id(operator_id)
-            .set_initial_supply(0)  # NFTs must have an initial supply of 0
-            .set_supply_type(SupplyType.INFINITE)
+            # NFTs start with an initial supply of 0 and no decimals
+            TokenCreateTransaction.for_nft_infinite("InfiniteNFTToken", "INFTT", operator_id)
             .set_admin_key(admin_key)    # Use the generated admin key
             .set_supply_key(supply_key)  # Use the generated supply key
             .freeze_with(client)
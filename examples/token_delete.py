@@ -1,23 +1,17 @@
 """
-uv run examples/token_delete.py
-python examples/token_delete.py
+uv run -m examples.token_delete
+python -m examples.token_delete
 
 """
-import os
 import sys
-from dotenv import load_dotenv
 
 from hiero_sdk_python import (
-    Client,
-    AccountId,
     PrivateKey,
-    Network,
     TokenCreateTransaction,
     TokenDeleteTransaction,
 )
 
-# Load environment variables from .env file
-load_dotenv()
+from ._shared_client import get_client
 
 
 def create_and_delete_token():
@@ -26,20 +20,7 @@ def create_and_delete_token():
     """
     # 1. Setup Client
     # =================================================================
-    print("Connecting to Hedera testnet...")
-    client = Client(Network(network='testnet'))
-
-    # Get the operator account from the .env file
-    try:
-        operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-        # NOTE: Assumes your operator key is a raw Ed25519 key
-        operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-    except (TypeError, ValueError):
-        print("Error: Please check OPERATOR_ID and OPERATOR_KEY in your .env file.")
-        sys.exit(1)
-
-    client.set_operator(operator_id, operator_key)
-    print(f"Using operator account: {operator_id}")
+    client, operator_id, operator_key = get_client()
 
     # 2. Generate a new admin key within the script
     # =================================================================
@@ -1,123 +1,114 @@
 """
-uv run examples/token_dissociate.py
-python examples/token_dissociate.py
+uv run -m examples.token_dissociate
+python -m examples.token_dissociate
 
 """
-import os
 import sys
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
 
 from hiero_sdk_python import (
-    Client,
-    AccountId,
     PrivateKey,
-    Network,
     Hbar,
     AccountCreateTransaction,
     TokenCreateTransaction,
     TokenAssociateTransaction,
     TokenDissociateTransaction,
+    BatchTransaction,
+    TransactionGetReceiptQuery,
+    ResponseCode,
 )
 
-# Load environment variables from .env file
-load_dotenv()
+from ._shared_client import get_client
 
 
 def token_dissociate():
     """
     A full example that creates an account, two tokens, associates them,
-    and finally dissociates them.
+    and finally dissociates them, using two atomic batches.
     """
     # 1. Setup Client
     # =================================================================
-    print("Connecting to Hedera testnet...")
-    client = Client(Network(network='testnet'))
+    client, operator_id, operator_key = get_client()
 
-    try:
-        operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-        operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-        client.set_operator(operator_id, operator_key)
-    except (TypeError, ValueError):
-        print("❌ Error: Please check OPERATOR_ID and OPERATOR_KEY in your .env file.")
-        sys.exit(1)
-
-    print(f"Using operator account: {operator_id}")
-
-    # 2. Create a new account to associate/dissociate with
+    # 2. Create a new account and two tokens in one batch
     # =================================================================
-    print("\nSTEP 1: Creating a new account...")
+    # The three creations are independent, so they are submitted as a single
+    # atomic batch (HIP-551) and reach consensus in one round. Each inner
+    # transaction is frozen with the operator as its batch key.
+    print("\nSTEP 1: Creating a new account and two tokens in one batch...")
     recipient_key = PrivateKey.generate("ed25519")
+    batch_key = operator_key.public_key()
     try:
-        # Build the transaction
-        tx = (
+        account_tx = (
             AccountCreateTransaction()
-            .set_key(recipient_key.public_key()) # <-- THE FIX: Call as a method
+            .set_key(recipient_key.public_key())
             .set_initial_balance(Hbar.from_tinybars(100_000_000)) # 1 Hbar
+            .batchify(client, batch_key)
         )
+        token_tx_1 = TokenCreateTransaction().set_token_name("First Token").set_token_symbol("TKA").set_initial_supply(1).set_treasury_account_id(operator_id).batchify(client, batch_key)
+        token_tx_2 = TokenCreateTransaction().set_token_name("Second Token").set_token_symbol("TKB").set_initial_supply(1).set_treasury_account_id(operator_id).batchify(client, batch_key)
+
+        batch_tx = BatchTransaction().set_inner_transactions([account_tx, token_tx_1, token_tx_2])
+        receipt = batch_tx.freeze_with(client).sign(operator_key).execute(client)
+        if receipt.status != ResponseCode.SUCCESS:
+            print(f"❌ Batch failed with status: {ResponseCode(receipt.status).name}")
+            sys.exit(1)
+
+        # Each inner transaction keeps its own ID, so its receipt holds the new entity ID.
+        # The receipt lookups are independent, so they are fetched concurrently.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            account_receipt, token_receipt_1, token_receipt_2 = executor.map(
+                lambda tx_id: TransactionGetReceiptQuery(tx_id).execute(client),
+                batch_tx.get_inner_transaction_ids(),
+            )
+        recipient_id = account_receipt.account_id
+        token_id_1 = token_receipt_1.token_id
+        token_id_2 = token_receipt_2.token_id
 
-        # Freeze the transaction, sign with the operator, then execute
-        receipt = tx.freeze_with(client).sign(operator_key).execute(client)
-        recipient_id = receipt.account_id
         print(f"✅ Success! Created new account with ID: {recipient_id}")
-    except Exception as e:
-        print(f"❌ Error creating new account: {e}")
-        sys.exit(1)
-
-    # 3. Create two new tokens
-    # =================================================================
-    print("\nSTEP 2: Creating two new tokens...")
-    try:
-        # Create First Token
-        tx1 = TokenCreateTransaction().set_token_name("First Token").set_token_symbol("TKA").set_initial_supply(1).set_treasury_account_id(operator_id)
-        receipt1 = tx1.freeze_with(client).sign(operator_key).execute(client)
-        token_id_1 = receipt1.token_id
-
-        # Create Second Token
-        tx2 = TokenCreateTransaction().set_token_name("Second Token").set_token_symbol("TKB").set_initial_supply(1).set_treasury_account_id(operator_id)
-        receipt2 = tx2.freeze_with(client).sign(operator_key).execute(client)
-        token_id_2 = receipt2.token_id
-
         print(f"✅ Success! Created tokens: {token_id_1} and {token_id_2}")
     except Exception as e:
-        print(f"❌ Error creating tokens: {e}")
+        print(f"❌ Error creating account and tokens: {e}")
         sys.exit(1)
 
-    # 4. Associate the tokens with the new account
+    # 3. Associate and then dissociate the tokens in a second batch
     # =================================================================
-    print(f"\nSTEP 3: Associating tokens with account {recipient_id}...")
+    # These steps need the IDs created above, which are only known once the
+    # first batch has reached consensus, so they go in a batch of their own.
+    print(f"\nSTEP 2: Associating and dissociating tokens for account {recipient_id}...")
     try:
-        receipt = (
+        associate_tx = (
             TokenAssociateTransaction()
             .set_account_id(recipient_id)
             .add_token_id(token_id_1)
             .add_token_id(token_id_2)
-            .freeze_with(client)
+            .batchify(client, batch_key)
             .sign(recipient_key)  # Recipient must sign to approve
-            .execute(client)
         )
-        print(f"✅ Success! Token association complete. Status: {receipt.status}")
-    except Exception as e:
-        print(f"❌ Error associating tokens: {e}")
-        sys.exit(1)
-
-    # 5. Dissociate the tokens from the new account
-    # =================================================================
-    print(f"\nSTEP 4: Dissociating tokens from account {recipient_id}...")
-    try:
-        receipt = (
+        dissociate_tx = (
             TokenDissociateTransaction()
             .set_account_id(recipient_id)
             .add_token_id(token_id_1)
             .add_token_id(token_id_2)
-            .freeze_with(client)
+            .batchify(client, batch_key)
             .sign(recipient_key) # Recipient must sign to approve
+        )
+
+        receipt = (
+            BatchTransaction()
+            .set_inner_transactions([associate_tx, dissociate_tx])
+            .freeze_with(client)
+            .sign(operator_key)
             .execute(client)
         )
-        print(f"✅ Success! Token dissociation complete.")
+        if receipt.status != ResponseCode.SUCCESS:
+            print(f"❌ Batch failed with status: {ResponseCode(receipt.status).name}")
+            sys.exit(1)
+
+        print("✅ Success! Token association and dissociation complete.")
     except Exception as e:
-        print(f"❌ Error dissociating tokens: {e}")
+        print(f"❌ Error associating and dissociating tokens: {e}")
         sys.exit(1)
 
-
 if __name__ == "__main__":
     token_dissociate()
\ No newline at end of file
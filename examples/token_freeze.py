@@ -1,24 +1,18 @@
 """
-uv run examples/token_freeze.py
-python examples/token_freeze.py
+uv run -m examples.token_freeze
+python -m examples.token_freeze
 
 """
-import os
 import sys
-from dotenv import load_dotenv
 
 from hiero_sdk_python import (
-    Client,
-    AccountId,
     PrivateKey,
-    Network,
     TokenCreateTransaction,
     TokenFreezeTransaction,
     TokenUnfreezeTransaction,
 )
 
-# Load environment variables from .env file
-load_dotenv()
+from ._shared_client import get_client
 
 
 def freeze_token():
@@ -28,18 +22,7 @@ def freeze_token():
     """
     # 1. Setup Client
     # =================================================================
-    print("Connecting to Hedera testnet...")
-    client = Client(Network(network='testnet'))
-
-    try:
-        operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-        operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-        client.set_operator(operator_id, operator_key)
-    except (TypeError, ValueError):
-        print("❌ Error: Please check OPERATOR_ID and OPERATOR_KEY in your .env file.")
-        sys.exit(1)
-
-    print(f"Using operator account: {operator_id}")
+    client, operator_id, operator_key = get_client()
 
     # 2. Generate a Freeze Key
     # =================================================================
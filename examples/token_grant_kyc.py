@@ -1,18 +1,12 @@
 """
-uv run examples/token_grant_kyc.py
-python examples/token_grant_kyc.py
+uv run -m examples.token_grant_kyc
+python -m examples.token_grant_kyc
 
 """
-import os
+import asyncio
 import sys
-from dotenv import load_dotenv
 
-from hiero_sdk_python import (
-    Client,
-    AccountId,
-    PrivateKey,
-    Network,
-)
+from hiero_sdk_python import PrivateKey
 from hiero_sdk_python.account.account_create_transaction import AccountCreateTransaction
 from hiero_sdk_python.hapi.services.basic_types_pb2 import TokenType
 from hiero_sdk_python.hbar import Hbar
@@ -22,22 +16,12 @@ from hiero_sdk_python.tokens.token_associate_transaction import TokenAssociateTr
 from hiero_sdk_python.tokens.token_grant_kyc_transaction import TokenGrantKycTransaction
 from hiero_sdk_python.tokens.token_create_transaction import TokenCreateTransaction
 
-load_dotenv()
+from ._shared_client import get_client
 
-def setup_client():
-    """Initialize and set up the client with operator account"""
-    network = Network(network='testnet')
-    client = Client(network)
 
-    operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-    operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-    client.set_operator(operator_id, operator_key)
-    
-    return client, operator_id, operator_key
-
-def create_fungible_token(client, operator_id, operator_key, kyc_private_key):
+async def create_fungible_token(client, operator_id, operator_key, kyc_private_key):
     """Create a fungible token"""
-    receipt = (
+    receipt = await (
         TokenCreateTransaction()
         .set_token_name("MyExampleFT")
         .set_token_symbol("EXFT")
@@ -50,7 +34,7 @@ def create_fungible_token(client, operator_id, operator_key, kyc_private_key):
         .set_admin_key(operator_key)
         .set_supply_key(operator_key)
         .set_kyc_key(kyc_private_key)  # Required key for granting KYC approval to accounts
-        .execute(client)
+        .execute_async(client)
     )
     
     if receipt.status != ResponseCode.SUCCESS:
@@ -80,7 +64,7 @@ def associate_token(client, token_id, account_id, account_private_key):
     
     print("Token successfully associated with account")
 
-def create_test_account(client):
+async def create_test_account(client):
     """Create a new account for testing"""
     # Generate private key for new account
     new_account_private_key = PrivateKey.generate()
@@ -94,7 +78,7 @@ def create_test_account(client):
         .freeze_with(client)
     )
     
-    receipt = transaction.execute(client)
+    receipt = await transaction.execute_async(client)
     
     # Check if account creation was successful
     if receipt.status != ResponseCode.SUCCESS:
@@ -107,25 +91,25 @@ def create_test_account(client):
     
     return account_id, new_account_private_key
 
-def token_grant_kyc():
+async def token_grant_kyc():
     """
     Demonstrates the token grant KYC functionality by:
     1. Setting up client with operator account
-    2. Creating a fungible token with KYC key
-    3. Creating a new account
-    4. Associating the token with the new account
-    5. Granting KYC to the new account
+    2. Creating a fungible token with KYC key and a new account concurrently
+    3. Associating the token with the new account
+    4. Granting KYC to the new account
     """
-    client, operator_id, operator_key = setup_client()
+    client, operator_id, operator_key = get_client()
     
     # Create KYC key
     kyc_private_key = PrivateKey.generate_ed25519()
     
-    # Create a fungible token with KYC key
-    token_id = create_fungible_token(client, operator_id, operator_key, kyc_private_key)
-    
-    # Create a new account
-    account_id, account_private_key = create_test_account(client)
+    # Create a fungible token with KYC key and a new account.
+    # Neither depends on the other, so both are submitted at the same time.
+    token_id, (account_id, account_private_key) = await asyncio.gather(
+        create_fungible_token(client, operator_id, operator_key, kyc_private_key),
+        create_test_account(client),
+    )
     
     # Associate the token with the new account
     associate_token(client, token_id, account_id, account_private_key)
@@ -148,4 +132,4 @@ def token_grant_kyc():
     print(f"Granted KYC for account {account_id} on token {token_id}")
 
 if __name__ == "__main__":
-    token_grant_kyc()
+    asyncio.run(token_grant_kyc())
@@ -1,23 +1,17 @@
 """
-uv run examples/token_mint_fungible.py
-python examples/token_mint_fungible.py
+uv run -m examples.token_mint_fungible
+python -m examples.token_mint_fungible
 
 """
-import os
 import sys
-from dotenv import load_dotenv
 
 from hiero_sdk_python import (
-    Client,
-    AccountId,
     PrivateKey,
-    Network,
     TokenCreateTransaction,
     TokenMintTransaction,
 )
 
-# Load environment variables from .env file
-load_dotenv()
+from ._shared_client import get_client
 
 
 def token_mint_fungible():
@@ -26,18 +20,7 @@ def token_mint_fungible():
     """
     # 1. Setup Client
     # =================================================================
-    print("Connecting to Hedera testnet...")
-    client = Client(Network(network='testnet'))
-
-    try:
-        operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-        operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-        client.set_operator(operator_id, operator_key)
-    except (TypeError, ValueError):
-        print("❌ Error: Please check OPERATOR_ID and OPERATOR_KEY in your .env file.")
-        sys.exit(1)
-
-    print(f"Using operator account: {operator_id}")
+    client, operator_id, operator_key = get_client()
 
     # 2. Generate a Supply Key
     # =================================================================
@@ -78,9 +61,7 @@ def token_mint_fungible():
     print(f"\nSTEP 3: Minting {mint_amount} more tokens for {token_id}...")
     try:
         receipt = (
-            TokenMintTransaction()
-            .set_token_id(token_id)
-            .set_amount(mint_amount)
+            TokenMintTransaction(token_id=token_id, amount=mint_amount)
             .freeze_with(client)
             .sign(supply_key)  # Must be signed by the supply key
             .execute(client)
@@ -1,24 +1,74 @@
 """
-uv run examples/token_mint_non_fungible.py
-python examples/token_mint_non_fungible.py
+uv run -m examples.token_mint_non_fungible
+python -m examples.token_mint_non_fungible
 
 """
-import os
 import sys
-from dotenv import load_dotenv
 
 from hiero_sdk_python import (
-    Client,
-    AccountId,
     PrivateKey,
-    Network,
     TokenCreateTransaction,
     TokenMintTransaction,
     TokenType,
+    BatchTransaction,
+    ResponseCode,
 )
 
-# Load environment variables from .env file
-load_dotenv()
+from ._shared_client import get_client
+
+
+# The network mints at most 10 NFTs per TokenMintTransaction
+MAX_NFTS_PER_MINT = 10
+# A BatchTransaction holds at most 50 inner transactions
+MAX_BATCH_INNER_TRANSACTIONS = 50
+
+
+def mint_nfts(client, token_id, supply_key, operator_key, metadata_list):
+    """
+    Mint one NFT per metadata entry, whatever the size of the list.
+
+    Small lists are minted with a single TokenMintTransaction. Larger lists are split
+    into mints of 10 that are submitted together in one atomic BatchTransaction
+    (HIP-551), so they all reach consensus in the same round. A batch holds at most
+    50 inner transactions, i.e. up to 500 NFTs.
+
+    Raises:
+        ValueError: If the list is empty or holds more than 500 entries.
+    """
+    if not metadata_list:
+        raise ValueError("At least one metadata entry is required to mint NFTs.")
+    max_nfts = MAX_NFTS_PER_MINT * MAX_BATCH_INNER_TRANSACTIONS
+    if len(metadata_list) > max_nfts:
+        raise ValueError(f"At most {max_nfts} NFTs can be minted at once, got {len(metadata_list)}.")
+
+    chunks = [
+        metadata_list[i:i + MAX_NFTS_PER_MINT]
+        for i in range(0, len(metadata_list), MAX_NFTS_PER_MINT)
+    ]
+
+    if len(chunks) == 1:
+        return (
+            TokenMintTransaction(token_id=token_id, metadata=metadata_list)
+            .freeze_with(client)
+            .sign(supply_key)  # Must be signed by the supply key
+            .execute(client)
+        )
+
+    # The operator pays for and signs the outer batch
+    batch_key = operator_key.public_key()
+    inner_transactions = [
+        TokenMintTransaction(token_id=token_id, metadata=chunk)
+        .batchify(client, batch_key)
+        .sign(supply_key)  # Each mint must still be signed by the supply key
+        for chunk in chunks
+    ]
+    return (
+        BatchTransaction()
+        .set_inner_transactions(inner_transactions)
+        .freeze_with(client)
+        .sign(operator_key)
+        .execute(client)
+    )
 
 
 def token_mint_non_fungible():
@@ -27,18 +77,7 @@ def token_mint_non_fungible():
     """
     # 1. Setup Client
     # =================================================================
-    print("Connecting to Hedera testnet...")
-    client = Client(Network(network='testnet'))
-
-    try:
-        operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-        operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-        client.set_operator(operator_id, operator_key)
-    except (TypeError, ValueError):
-        print("❌ Error: Please check OPERATOR_ID and OPERATOR_KEY in your .env file.")
-        sys.exit(1)
-
-    print(f"Using operator account: {operator_id}")
+    client, operator_id, operator_key = get_client()
 
     # 2. Generate a Supply Key
     # =================================================================
@@ -74,7 +113,10 @@ def token_mint_non_fungible():
 
     # 4. Mint new NFTs with metadata
     # =================================================================
-    # Define metadata directly in the script instead of loading from a file
+    # Define metadata directly in the script instead of loading from a file.
+    # Lists longer than 10 entries are minted in one batch, see mint_nfts().
+    # Metadata must be bytes; when it comes from strings, encode them once up front,
+    # e.g. list(map(str.encode, strings)), and reuse the list across mint runs.
     metadata_list = [
         b"METADATA_A",
         b"METADATA_B",
@@ -82,22 +124,18 @@ def token_mint_non_fungible():
     ]
     print(f"\nSTEP 3: Minting {len(metadata_list)} new NFTs for token {token_id}...")
     try:
-        receipt = (
-            TokenMintTransaction()
-            .set_token_id(token_id)
-            .set_metadata(metadata_list) # Set the list of metadata
-            .freeze_with(client)
-            .sign(supply_key)  # Must be signed by the supply key
-            .execute(client)
-        )
-        
+        receipt = mint_nfts(client, token_id, supply_key, operator_key, metadata_list)
+
+        if receipt.status != ResponseCode.SUCCESS:
+            print(f"❌ NFT minting failed with status: {ResponseCode(receipt.status).name}")
+            sys.exit(1)
+
         # THE FIX: The receipt confirms status, it does not contain serial numbers.
-        print(f"✅ Success! NFT minting complete.")
+        print(f"✅ Success! NFT minting complete. Status: {ResponseCode(receipt.status).name}")
 
     except Exception as e:
         print(f"❌ Error minting NFTs: {e}")
         sys.exit(1)
 
-
 if __name__ == "__main__":
     token_mint_non_fungible()
\ No newline at end of file
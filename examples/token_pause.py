@@ -1,18 +1,10 @@
 """
-uv run examples/token_pause.py
-python examples/token_pause.py
+uv run -m examples.token_pause
+python -m examples.token_pause
 
 """
-import os
 import sys
-from dotenv import load_dotenv
-
-from hiero_sdk_python import (
-    Client,
-    AccountId,
-    PrivateKey,
-    Network
-)
+
 from hiero_sdk_python.response_code import ResponseCode
 from hiero_sdk_python.tokens.supply_type import SupplyType
 from hiero_sdk_python.tokens.token_type import TokenType
@@ -21,20 +13,7 @@ from hiero_sdk_python.tokens.token_pause_transaction import TokenPauseTransactio
 from hiero_sdk_python.tokens.token_delete_transaction import TokenDeleteTransaction
 from hiero_sdk_python.query.token_info_query import TokenInfoQuery
 
-load_dotenv()
-
-def setup_client():
-    """Initialize and set up the client with operator account"""
-    # Initialize network and client
-    network = Network(network='testnet')
-    client = Client(network)
-
-    # Set up operator account
-    operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-    operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-    client.set_operator(operator_id, operator_key)
-    
-    return client, operator_id, operator_key
+from ._shared_client import get_client
 
 def assert_success(receipt, action: str):
     """
@@ -124,7 +103,7 @@ def token_pause():
       3. Verifying pause status
       4. Attempting (and failing) to delete the paused token because it is paused
     """
-    client, operator_id, operator_key = setup_client()
+    client, operator_id, operator_key = get_client()
 
     pause_key = operator_key  # for token pause 
     admin_key = operator_key  # for token delete 
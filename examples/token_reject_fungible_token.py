@@ -1,18 +1,14 @@
 """
-uv run examples/token_reject_fungible_token.py
-python examples/token_reject_fungible_token.py
+uv run -m examples.token_reject_fungible_token
+python -m examples.token_reject_fungible_token
 
 """
-import os
-import sys
-from dotenv import load_dotenv
+import asyncio
 
 from hiero_sdk_python import (
-    Client,
-    AccountId,
     PrivateKey,
-    Network,
     TransferTransaction,
+    BatchTransaction,
 )
 from hiero_sdk_python.account.account_create_transaction import AccountCreateTransaction
 from hiero_sdk_python.hapi.services.basic_types_pb2 import TokenType
@@ -24,37 +20,25 @@ from hiero_sdk_python.tokens.token_associate_transaction import TokenAssociateTr
 from hiero_sdk_python.tokens.token_create_transaction import TokenCreateTransaction
 from hiero_sdk_python.tokens.token_reject_transaction import TokenRejectTransaction
 
-load_dotenv()
+from ._shared_client import get_client
 
-def setup_client():
-    """Initialize and set up the client with operator account"""
-    network = Network(network='testnet')
-    client = Client(network)
-
-    operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-    operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-    client.set_operator(operator_id, operator_key)
-    
-    return client
-
-def create_test_account(client):
+async def create_test_account(client):
     """Create a new account for testing"""
     # Generate private key for new account
     new_account_private_key = PrivateKey.generate_ed25519()
     new_account_public_key = new_account_private_key.public_key()
     
     # Create new account with initial balance of 1 HBAR
-    receipt = (
+    receipt = await (
         AccountCreateTransaction()
         .set_key(new_account_public_key)
         .set_initial_balance(Hbar(1))
-        .execute(client)
+        .execute_async(client)
     )
     
     # Check if account creation was successful
     if receipt.status != ResponseCode.SUCCESS:
-        print(f"Account creation failed with status: {ResponseCode(receipt.status).name}")
-        sys.exit(1)
+        raise RuntimeError(f"Account creation failed with status: {ResponseCode(receipt.status).name}")
     
     # Get account ID from receipt
     account_id = receipt.account_id
@@ -62,7 +46,7 @@ def create_test_account(client):
     
     return account_id, new_account_private_key
 
-def create_fungible_token(client: 'Client', treasury_id, treasury_private_key):
+def create_fungible_token(client, treasury_id, treasury_private_key):
     """Create a fungible token"""
     receipt = (
         TokenCreateTransaction()
@@ -83,68 +67,60 @@ def create_fungible_token(client: 'Client', treasury_id, treasury_private_key):
     )
     
     if receipt.status != ResponseCode.SUCCESS:
-        print(f"Fungible token creation failed with status: {ResponseCode(receipt.status).name}")
-        sys.exit(1)
+        raise RuntimeError(f"Fungible token creation failed with status: {ResponseCode(receipt.status).name}")
     
     token_id = receipt.token_id
     print(f"Fungible token created with ID: {token_id}")
     
     return token_id
 
-def associate_token(client, receiver_id, token_id, receiver_private_key):
-    """Associate token with an account"""
+def associate_token(client, receiver_id, token_id, receiver_private_key, batch_key):
+    """Prepare the association of the token with an account for a batch"""
     # Associate the token_id with the new account
-    receipt = (
+    return (
         TokenAssociateTransaction()
         .set_account_id(receiver_id)
         .add_token_id(token_id)
-        .freeze_with(client)
+        .batchify(client, batch_key)
         .sign(receiver_private_key) # Has to be signed here by receiver's key
-        .execute(client)
     )
-    
-    if receipt.status != ResponseCode.SUCCESS:
-        print(f"Token association failed with status: {ResponseCode(receipt.status).name}")
-        sys.exit(1)
-    
-    print(f"Token successfully associated with account: {receiver_id}")
 
-def transfer_tokens(client, treasury_id, treasury_private_key, receiver_id, token_id, amount=10):
-    """Transfer tokens to the receiver account so we can later reject them"""
+def transfer_tokens(client, treasury_id, treasury_private_key, receiver_id, token_id, batch_key, amount=10):
+    """Prepare the transfer of tokens to the receiver account for a batch, so we can later reject them"""
     # Transfer tokens to the receiver account
-    receipt = (
+    return (
         TransferTransaction()
         .add_token_transfer(token_id, treasury_id, -amount)
         .add_token_transfer(token_id, receiver_id, amount)
-        .freeze_with(client)
+        .batchify(client, batch_key)
         .sign(treasury_private_key)
+    )
+
+def associate_and_transfer(client, inner_transactions):
+    """Execute the association and transfer together in one atomic batch"""
+    receipt = (
+        BatchTransaction()
+        .set_inner_transactions(inner_transactions)
+        .freeze_with(client)
+        .sign(client.operator_private_key) # The operator key is the batch key of the inner transactions
         .execute(client)
     )
-    
-    # Check if transfer was successful
+
+    # Check if the association and transfer were successful
     if receipt.status != ResponseCode.SUCCESS:
-        print(f"Transfer failed with status: {ResponseCode(receipt.status).name}")
-        sys.exit(1)
-    
-    print(f"Successfully transferred {amount} tokens to receiver account {receiver_id}")
-    
-def get_token_balances(client, treasury_id, receiver_id, token_id):
+        raise RuntimeError(f"Association and transfer failed with status: {ResponseCode(receipt.status).name}")
+
+async def get_token_balances(client, treasury_id, receiver_id, token_id):
     """Get token balances for both accounts"""
-    token_balance = (
-        CryptoGetAccountBalanceQuery()
-        .set_account_id(treasury_id)
-        .execute(client)
+    # The two balances are independent, so both queries are sent at the same time
+    token_balance, receiver_token_balance = await asyncio.gather(
+        CryptoGetAccountBalanceQuery().set_account_id(treasury_id).execute_async(client),
+        CryptoGetAccountBalanceQuery().set_account_id(receiver_id).execute_async(client),
     )
     print(f"Token balance of treasury {treasury_id}: {token_balance.token_balances[token_id]}")
-    
-    receiver_token_balance = (
-        CryptoGetAccountBalanceQuery()
-        .set_account_id(receiver_id)
-        .execute(client)
-    )
     print(f"Token balance of receiver {receiver_id}: {receiver_token_balance.token_balances[token_id]}")
 
-def token_reject_fungible():
+async def token_reject_fungible():
     """
     Demonstrates the fungible token reject functionality by:
     1. Creating a new treasury account
@@ -154,24 +130,30 @@ def token_reject_fungible():
     5. Transferring tokens to the receiver account
     6. Rejecting the tokens from the receiver account
     """
-    client = setup_client()
-    # Create treasury/sender account that will create and send tokens
-    treasury_id, treasury_private_key = create_test_account(client)
-    # Create receiver account that will receive and later reject tokens
-    receiver_id, receiver_private_key = create_test_account(client)
+    client, _, _ = get_client()
+    # Create treasury/sender account that will create and send tokens and
+    # receiver account that will receive and later reject tokens.
+    # Neither depends on the other, so both are submitted at the same time.
+    (treasury_id, treasury_private_key), (receiver_id, receiver_private_key) = await asyncio.gather(
+        create_test_account(client),
+        create_test_account(client),
+    )
     
     # Create a fungible token with the treasury account as owner and signer
     token_id = create_fungible_token(client, treasury_id, treasury_private_key)
     
-    # Associate token with the receiver account so they can receive the tokens from the treasury
-    associate_token(client, receiver_id, token_id, receiver_private_key)
-    
-    # Transfer tokens to the receiver account
-    transfer_tokens(client, treasury_id, treasury_private_key, receiver_id, token_id)
+    # Associate token with the receiver account so they can receive the tokens from the treasury,
+    # then transfer tokens to the receiver account. Both go in one atomic batch (HIP-551),
+    # so they need a single round-trip and a single receipt.
+    batch_key = client.operator_private_key.public_key()
+    associate_tx = associate_token(client, receiver_id, token_id, receiver_private_key, batch_key)
+    transfer_tx = transfer_tokens(client, treasury_id, treasury_private_key, receiver_id, token_id, batch_key)
+    associate_and_transfer(client, [associate_tx, transfer_tx])
+    print(f"Token associated with and tokens transferred to receiver account {receiver_id}")
 
     # Get and print token balances before rejection to show the initial state
     print("\nToken balances before rejection:")
-    get_token_balances(client, treasury_id, receiver_id, token_id)
+    await get_token_balances(client, treasury_id, receiver_id, token_id)
     
     # Receiver rejects the fungible tokens that were previously transferred to them
     receipt = (
@@ -184,14 +166,13 @@ def token_reject_fungible():
     )
     
     if receipt.status != ResponseCode.SUCCESS:
-        print(f"Token rejection failed with status: {ResponseCode(receipt.status).name}")
-        sys.exit(1)
+        raise RuntimeError(f"Token rejection failed with status: {ResponseCode(receipt.status).name}")
         
     print(f"Successfully rejected token {token_id} from account {receiver_id}")
     
     # Get and print token balances after rejection to show the final state
     print("\nToken balances after rejection:")
-    get_token_balances(client, treasury_id, receiver_id, token_id)
+    await get_token_balances(client, treasury_id, receiver_id, token_id)
     
 if __name__ == "__main__":
-    token_reject_fungible()
+    asyncio.run(token_reject_fungible())
@@ -1,18 +1,14 @@
 """
-uv run examples/token_reject_nft.py
-python examples/token_reject_nft.py
+uv run -m examples.token_reject_nft
+python -m examples.token_reject_nft
 
 """
-import os
-import sys
-from dotenv import load_dotenv
+import asyncio
 
 from hiero_sdk_python import (
-    Client,
-    AccountId,
     PrivateKey,
-    Network,
     TransferTransaction,
+    BatchTransaction,
 )
 from hiero_sdk_python.account.account_create_transaction import AccountCreateTransaction
 from hiero_sdk_python.hapi.services.basic_types_pb2 import TokenType
@@ -26,37 +22,25 @@ from hiero_sdk_python.tokens.token_create_transaction import TokenCreateTransact
 from hiero_sdk_python.tokens.token_mint_transaction import TokenMintTransaction
 from hiero_sdk_python.tokens.token_reject_transaction import TokenRejectTransaction
 
-load_dotenv()
+from ._shared_client import get_client
 
-def setup_client():
-    """Initialize and set up the client with operator account"""
-    network = Network(network='testnet')
-    client = Client(network)
-
-    operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-    operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-    client.set_operator(operator_id, operator_key)
-    
-    return client
-
-def create_test_account(client):
+async def create_test_account(client):
     """Create a new account for testing"""
     # Generate private key for new account
     new_account_private_key = PrivateKey.generate_ed25519()
     new_account_public_key = new_account_private_key.public_key()
     
     # Create new account with initial balance of 1 HBAR
-    receipt = (
+    receipt = await (
         AccountCreateTransaction()
         .set_key(new_account_public_key)
         .set_initial_balance(Hbar(1))
-        .execute(client)
+        .execute_async(client)
     )
     
     # Check if account creation was successful
     if receipt.status != ResponseCode.SUCCESS:
-        print(f"Account creation failed with status: {ResponseCode(receipt.status).name}")
-        sys.exit(1)
+        raise RuntimeError(f"Account creation failed with status: {ResponseCode(receipt.status).name}")
     
     # Get account ID from receipt
     account_id = receipt.account_id
@@ -86,8 +70,7 @@ def create_nft(client, treasury_id, treasury_private_key):
     
     # Check if nft creation was successful
     if receipt.status != ResponseCode.SUCCESS:
-        print(f"NFT creation failed with status: {ResponseCode(receipt.status).name}")
-        sys.exit(1)
+        raise RuntimeError(f"NFT creation failed with status: {ResponseCode(receipt.status).name}")
     
     # Get token ID from receipt
     nft_token_id = receipt.token_id
@@ -95,79 +78,63 @@ def create_nft(client, treasury_id, treasury_private_key):
     
     return nft_token_id
 
-def mint_nfts(client, nft_token_id, metadata_list, treasury_private_key):
-    """Mint a non-fungible token"""
-    receipt = (
+def mint_nfts(client, nft_token_id, metadata_list, treasury_private_key, batch_key):
+    """Prepare the minting of non-fungible tokens for a batch"""
+    return (
         TokenMintTransaction()
         .set_token_id(nft_token_id)
         .set_metadata(metadata_list)
-        .freeze_with(client)
+        .batchify(client, batch_key)
         .sign(treasury_private_key) # Has to be signed here by treasury's key because they own the supply key
-        .execute(client)
     )
-    
-    if receipt.status != ResponseCode.SUCCESS:
-        print(f"NFT minting failed with status: {ResponseCode(receipt.status).name}")
-        sys.exit(1)
-    
-    print(f"NFT minted with serial numbers: {receipt.serial_numbers}")
-    
-    return [NftId(nft_token_id, serial_number) for serial_number in receipt.serial_numbers]
 
-def associate_token(client, receiver_id, nft_token_id, receiver_private_key):
-    """Associate token with an account"""
+def associate_token(client, receiver_id, nft_token_id, receiver_private_key, batch_key):
+    """Prepare the association of the token with an account for a batch"""
     # Associate the token_id with the new account
-    receipt = (
+    return (
         TokenAssociateTransaction()
         .set_account_id(receiver_id)
         .add_token_id(nft_token_id)
-        .freeze_with(client)
+        .batchify(client, batch_key)
         .sign(receiver_private_key) # Has to be signed here by receiver's key
-        .execute(client)
     )
-    
-    if receipt.status != ResponseCode.SUCCESS:
-        print(f"Token association failed with status: {ResponseCode(receipt.status).name}")
-        sys.exit(1)
-    
-    print(f"Token successfully associated with account: {receiver_id}")
 
-def transfer_nfts(client, treasury_id, treasury_private_key, receiver_id, nft_ids):
-    """Transfer NFTs to the receiver account so we can later reject them"""
+def transfer_nfts(client, treasury_id, treasury_private_key, receiver_id, nft_ids, batch_key):
+    """Prepare the transfer of NFTs to the receiver account for a batch, so we can later reject them"""
     # Transfer NFTs to the receiver account
-    receipt = (
+    return (
         TransferTransaction()
         .add_nft_transfer(nft_ids[0], treasury_id, receiver_id)
         .add_nft_transfer(nft_ids[1], treasury_id, receiver_id)
-        .freeze_with(client)
+        .batchify(client, batch_key)
         .sign(treasury_private_key)
+    )
+
+def mint_associate_and_transfer(client, inner_transactions):
+    """Execute the minting, association and transfer together in one atomic batch"""
+    receipt = (
+        BatchTransaction()
+        .set_inner_transactions(inner_transactions)
+        .freeze_with(client)
+        .sign(client.operator_private_key) # The operator key is the batch key of the inner transactions
         .execute(client)
     )
-    
-    # Check if transfer was successful
+
+    # Check if the minting, association and transfer were successful
     if receipt.status != ResponseCode.SUCCESS:
-        print(f"Transfer failed with status: {ResponseCode(receipt.status).name}")
-        sys.exit(1)
-    
-    print(f"Successfully transferred NFTs to receiver account {receiver_id}")
-    
-def get_nft_balances(client, treasury_id, receiver_id, nft_token_id):
+        raise RuntimeError(f"Minting, association and transfer failed with status: {ResponseCode(receipt.status).name}")
+
+async def get_nft_balances(client, treasury_id, receiver_id, nft_token_id):
     """Get NFT balances for both accounts"""
-    token_balance = (
-        CryptoGetAccountBalanceQuery()
-        .set_account_id(treasury_id)
-        .execute(client)
+    # The two balances are independent, so both queries are sent at the same time
+    token_balance, receiver_token_balance = await asyncio.gather(
+        CryptoGetAccountBalanceQuery().set_account_id(treasury_id).execute_async(client),
+        CryptoGetAccountBalanceQuery().set_account_id(receiver_id).execute_async(client),
     )
     print(f"NFT balance of treasury {treasury_id}: {token_balance.token_balances[nft_token_id]}")
-    
-    receiver_token_balance = (
-        CryptoGetAccountBalanceQuery()
-        .set_account_id(receiver_id)
-        .execute(client)
-    )
     print(f"NFT balance of receiver {receiver_id}: {receiver_token_balance.token_balances[nft_token_id]}")
 
-def token_reject_nft():
+async def token_reject_nft():
     """
     Demonstrates the NFT token reject functionality by:
     1. Creating a new treasury account
@@ -178,26 +145,35 @@ def token_reject_nft():
     6. Transferring the NFTs to the receiver account
     7. Rejecting the NFTs from the receiver account
     """
-    client = setup_client()
-    # Create treasury/sender account that will create and send tokens
-    treasury_id, treasury_private_key = create_test_account(client)
-    # Create receiver account that will receive and later reject tokens
-    receiver_id, receiver_private_key = create_test_account(client)
+    client, _, _ = get_client()
+    # Create treasury/sender account that will create and send tokens and
+    # receiver account that will receive and later reject tokens.
+    # Neither depends on the other, so both are submitted at the same time.
+    (treasury_id, treasury_private_key), (receiver_id, receiver_private_key) = await asyncio.gather(
+        create_test_account(client),
+        create_test_account(client),
+    )
     
     # Create a new NFT collection with the treasury account as owner
     nft_token_id = create_nft(client, treasury_id, treasury_private_key)
-    # Mint 2 NFTs in the collection with example metadata and get their unique IDs that we will send and reject
-    nft_ids = mint_nfts(client, nft_token_id, [b"ExampleMetadata 1", b"ExampleMetadata 2"], treasury_private_key)
     
-    # Associate the NFT token with the receiver account so they can receive the NFTs
-    associate_token(client, receiver_id, nft_token_id, receiver_private_key)
-    
-    # Transfer NFTs to the receiver account
-    transfer_nfts(client, treasury_id, treasury_private_key, receiver_id, nft_ids)
+    # Mint 2 NFTs in the collection, associate the NFT token with the receiver account so they can
+    # receive the NFTs, then transfer the NFTs to the receiver account. All three go in one atomic
+    # batch (HIP-551), so they need a single round-trip and a single receipt. The inner transactions
+    # run in order, and the first mint of a new collection always gets serial numbers 1, 2, ...,
+    # so the IDs of the NFTs that we will send and reject are known before the batch is executed.
+    metadata_list = [b"ExampleMetadata 1", b"ExampleMetadata 2"]
+    nft_ids = [NftId(nft_token_id, serial_number) for serial_number in range(1, len(metadata_list) + 1)]
+    batch_key = client.operator_private_key.public_key()
+    mint_tx = mint_nfts(client, nft_token_id, metadata_list, treasury_private_key, batch_key)
+    associate_tx = associate_token(client, receiver_id, nft_token_id, receiver_private_key, batch_key)
+    transfer_tx = transfer_nfts(client, treasury_id, treasury_private_key, receiver_id, nft_ids, batch_key)
+    mint_associate_and_transfer(client, [mint_tx, associate_tx, transfer_tx])
+    print(f"NFTs {nft_ids[0]} and {nft_ids[1]} minted and transferred to receiver account {receiver_id}")
 
     # Get and print NFT balances before rejection to show the initial state
     print("\nNFT balances before rejection:")
-    get_nft_balances(client, treasury_id, receiver_id, nft_token_id)
+    await get_nft_balances(client, treasury_id, receiver_id, nft_token_id)
     
     # Receiver rejects the NFTs that were previously transferred to them
     receipt = (
@@ -210,14 +186,13 @@ def token_reject_nft():
     )
     
     if receipt.status != ResponseCode.SUCCESS:
-        print(f"NFT rejection failed with status: {ResponseCode(receipt.status).name}")
-        sys.exit(1)
+        raise RuntimeError(f"NFT rejection failed with status: {ResponseCode(receipt.status).name}")
     
     print(f"Successfully rejected NFTs {nft_ids[0]} and {nft_ids[1]} from account {receiver_id}")
     
     # Get and print NFT balances after rejection to show the final state
     print("\nNFT balances after rejection:")
-    get_nft_balances(client, treasury_id, receiver_id, nft_token_id)
+    await get_nft_balances(client, treasury_id, receiver_id, nft_token_id)
     
 if __name__ == "__main__":
-    token_reject_nft()
+    asyncio.run(token_reject_nft())
@@ -76,7 +76,7 @@ def associate_token(client, token_id, account_id, account_private_key):
     receipt = associate_transaction.execute(client)
     
     if receipt.status != ResponseCode.SUCCESS:
-        print(f"Token association failed with status: {ResponseCode.get_name(receipt.status)}")
+        print(f"Token association failed with status: {ResponseCode(receipt.status).name}")
         sys.exit(1)
     
     print("Token successfully associated with account")
@@ -99,7 +99,7 @@ def create_test_account(client):
     
     # Check if account creation was successful
     if receipt.status != ResponseCode.SUCCESS:
-        print(f"Account creation failed with status: {ResponseCode.get_name(receipt.status)}")
+        print(f"Account creation failed with status: {ResponseCode(receipt.status).name}")
         sys.exit(1)
     
     # Get account ID from receipt
@@ -120,7 +120,7 @@ def grant_kyc(client, token_id, account_id, kyc_private_key):
     )
     
     if receipt.status != ResponseCode.SUCCESS:
-        print(f"Token grant KYC failed with status: {ResponseCode.get_name(receipt.status)}")
+        print(f"Token grant KYC failed with status: {ResponseCode(receipt.status).name}")
         sys.exit(1)
     
     print(f"Granted KYC for account {account_id} on token {token_id}")
@@ -164,7 +164,7 @@ def token_revoke_kyc():
     
     # Check if the transaction was successful
     if receipt.status != ResponseCode.SUCCESS:
-        print(f"Token revoke KYC failed with status: {ResponseCode.get_name(receipt.status)}")
+        print(f"Token revoke KYC failed with status: {ResponseCode(receipt.status).name}")
         sys.exit(1)
     
     print(f"Revoked KYC for account {account_id} on token {token_id}")
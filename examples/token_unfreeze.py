@@ -1,24 +1,16 @@
 """
-uv run examples/token_unfreeze.py
-python examples/token_unfreeze.py
+uv run -m examples.token_unfreeze
+python -m examples.token_unfreeze
 
 """
-import os
-import sys
-from dotenv import load_dotenv
-
 from hiero_sdk_python import (
-    Client,
-    AccountId,
     PrivateKey,
-    Network,
     TokenCreateTransaction,
     TokenFreezeTransaction,
     TokenUnfreezeTransaction,
 )
 
-# Load environment variables from .env file
-load_dotenv()
+from ._shared_client import get_client
 
 
 def token_unfreeze():
@@ -28,18 +20,7 @@ def token_unfreeze():
     """
     # 1. Setup Client
     # =================================================================
-    print("Connecting to Hedera testnet...")
-    client = Client(Network(network='testnet'))
-
-    try:
-        operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-        operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-        client.set_operator(operator_id, operator_key)
-    except (TypeError, ValueError):
-        print("❌ Error: Please check OPERATOR_ID and OPERATOR_KEY in your .env file.")
-        sys.exit(1)
-
-    print(f"Using operator account: {operator_id}")
+    client, operator_id, operator_key = get_client()
 
     # 2. Generate a Freeze Key on the fly
     # =================================================================
@@ -70,8 +51,7 @@ def token_unfreeze():
         token_id = receipt.token_id
         print(f"✅ Success! Created token with ID: {token_id}")
     except Exception as e:
-        print(f"❌ Error creating token: {e}")
-        sys.exit(1)
+        raise RuntimeError(f"Token creation failed: {e}") from e
 
     # 4. Freeze the token for the operator account
     # =================================================================
@@ -87,8 +67,7 @@ def token_unfreeze():
         )
         print(f"✅ Success! Token freeze complete.")
     except Exception as e:
-        print(f"❌ Error freezing token: {e}")
-        sys.exit(1)
+        raise RuntimeError(f"Token freeze failed: {e}") from e
 
     # 5. Unfreeze the token for the operator account
     # =================================================================
@@ -104,8 +83,7 @@ def token_unfreeze():
         )
         print(f"✅ Success! Token unfreeze complete.")
     except Exception as e:
-        print(f"❌ Error unfreezing token: {e}")
-        sys.exit(1)
+        raise RuntimeError(f"Token unfreeze failed: {e}") from e
 
 
 if __name__ == "__main__":
@@ -1,17 +1,12 @@
 """
-uv run examples/token_update_fungible.py
-python examples/token_update_fungible.py
+uv run -m examples.token_update_fungible
+python -m examples.token_update_fungible
 
 """
-import os
 import sys
-from dotenv import load_dotenv
 
 from hiero_sdk_python import (
-    Client,
-    AccountId,
     PrivateKey,
-    Network,
 )
 from hiero_sdk_python.hapi.services.basic_types_pb2 import TokenType
 from hiero_sdk_python.query.token_info_query import TokenInfoQuery
@@ -20,18 +15,7 @@ from hiero_sdk_python.tokens.supply_type import SupplyType
 from hiero_sdk_python.tokens.token_create_transaction import TokenCreateTransaction
 from hiero_sdk_python.tokens.token_update_transaction import TokenUpdateTransaction
 
-load_dotenv()
-
-def setup_client():
-    """Initialize and set up the client with operator account"""
-    network = Network(network='testnet')
-    client = Client(network)
-
-    operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-    operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-    client.set_operator(operator_id, operator_key)
-    
-    return client, operator_id, operator_key
+from ._shared_client import get_client
 
 def create_fungible_token(client, operator_id, operator_key, metadata_key):
     """
@@ -63,7 +47,7 @@ def create_fungible_token(client, operator_id, operator_key, metadata_key):
     
     # Check if token creation was successful
     if receipt.status != ResponseCode.SUCCESS:
-        print(f"Fungible token creation failed with status: {ResponseCode.get_name(receipt.status)}")
+        print(f"Fungible token creation failed with status: {ResponseCode(receipt.status).name}")
         sys.exit(1)
     
     # Get token ID from receipt
@@ -95,7 +79,7 @@ def update_token_data(client, token_id, update_metadata, update_token_name, upda
     )
     
     if receipt.status != ResponseCode.SUCCESS:
-        print(f"Token metadata update failed with status: {ResponseCode.get_name(receipt.status)}")
+        print(f"Token metadata update failed with status: {ResponseCode(receipt.status).name}")
         sys.exit(1)
     
     print(f"Successfully updated token data")
@@ -109,7 +93,7 @@ def token_update_fungible():
     4. Updating the token's metadata, name, symbol and memo
     5. Verifying the updated token info
     """
-    client, operator_id, operator_key = setup_client()
+    client, operator_id, operator_key = get_client()
     
     # Create metadata key
     metadata_private_key = PrivateKey.generate_ed25519()
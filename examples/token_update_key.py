@@ -1,18 +1,13 @@
 
 """
-uv run examples/token_update_key.py
-python examples/token_update_key.py
+uv run -m examples.token_update_key
+python -m examples.token_update_key
 
 """
-import os
 import sys
-from dotenv import load_dotenv
 
 from hiero_sdk_python import (
-    Client,
-    AccountId,
     PrivateKey,
-    Network,
 )
 from hiero_sdk_python.hapi.services.basic_types_pb2 import TokenType
 from hiero_sdk_python.query.token_info_query import TokenInfoQuery
@@ -22,18 +17,7 @@ from hiero_sdk_python.tokens.supply_type import SupplyType
 from hiero_sdk_python.tokens.token_create_transaction import TokenCreateTransaction
 from hiero_sdk_python.tokens.token_update_transaction import TokenUpdateTransaction
 
-load_dotenv()
-
-def setup_client():
-    """Initialize and set up the client with operator account"""
-    network = Network(network='testnet')
-    client = Client(network)
-
-    operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-    operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-    client.set_operator(operator_id, operator_key)
-    
-    return client, operator_id
+from ._shared_client import get_client
 
 def create_fungible_token(client, operator_id, admin_key, wipe_key):
     """Create a fungible token"""
@@ -56,7 +40,7 @@ def create_fungible_token(client, operator_id, admin_key, wipe_key):
     
     # Check if token creation was successful
     if receipt.status != ResponseCode.SUCCESS:
-        print(f"Fungible token creation failed with status: {ResponseCode.get_name(receipt.status)}")
+        print(f"Fungible token creation failed with status: {ResponseCode(receipt.status).name}")
         sys.exit(1)
     
     # Get token ID from receipt
@@ -100,7 +84,7 @@ def update_wipe_key_full_validation(client, token_id, old_wipe_key):
     )
     
     if receipt.status != ResponseCode.SUCCESS:
-        print(f"Token update failed with status: {ResponseCode.get_name(receipt.status)}")
+        print(f"Token update failed with status: {ResponseCode(receipt.status).name}")
         sys.exit(1)
     
     print(f"Successfully updated wipe key")
@@ -117,7 +101,7 @@ def token_update_key():
     3. Checking the current token info and key values
     4. Updating the wipe key with full validation
     """
-    client, operator_id = setup_client()
+    client, operator_id, _ = get_client()
     
     admin_key = PrivateKey.generate_ed25519()
     wipe_key = PrivateKey.generate_ed25519()
@@ -1,17 +1,14 @@
 """
-uv run examples/token_update_nfts.py
-python examples/token_update_nfts.py
+uv run -m examples.token_update_nfts
+python -m examples.token_update_nfts
 
 """
-import os
 import sys
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+
 
 from hiero_sdk_python import (
-    Client,
-    AccountId,
     PrivateKey,
-    Network,
 )
 from hiero_sdk_python.hapi.services.basic_types_pb2 import TokenType
 from hiero_sdk_python.response_code import ResponseCode
@@ -22,18 +19,7 @@ from hiero_sdk_python.tokens.token_mint_transaction import TokenMintTransaction
 from hiero_sdk_python.tokens.token_update_nfts_transaction import TokenUpdateNftsTransaction
 from hiero_sdk_python.query.token_nft_info_query import TokenNftInfoQuery
 
-load_dotenv()
-
-def setup_client():
-    """Initialize and set up the client with operator account"""
-    network = Network(network='testnet')
-    client = Client(network)
-
-    operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-    operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-    client.set_operator(operator_id, operator_key)
-    
-    return client, operator_id, operator_key
+from ._shared_client import get_client
 
 def create_nft(client, operator_id, operator_key, metadata_key):
     """Create a non-fungible token"""
@@ -92,6 +78,13 @@ def get_nft_info(client, nft_id):
     
     return info
 
+def get_nft_infos(client, nft_ids):
+    """Get information about several NFTs"""
+    # The queries are independent, so they are sent at the same time
+    # (at most 10 at once, to stay clear of the network's query throttles)
+    with ThreadPoolExecutor(max_workers=min(len(nft_ids), 10)) as executor:
+        return list(executor.map(lambda nft_id: get_nft_info(client, nft_id), nft_ids))
+
 def update_nft_metadata(client, nft_token_id, serial_numbers, new_metadata, metadata_private_key):
     """Update metadata for NFTs in a collection"""
     receipt = (
@@ -120,7 +113,7 @@ def token_update_nfts():
     5. Updating metadata for the first NFT
     6. Verifying the updated NFT metadata
     """
-    client, operator_id, operator_key = setup_client()
+    client, operator_id, operator_key = get_client()
     
     # Create metadata key
     metadata_private_key = PrivateKey.generate_ed25519()
@@ -139,8 +132,7 @@ def token_update_nfts():
     
     # Get and print information about the NFTs
     print("\nCheck that the NFTs have the initial metadata")
-    for nft_id in nft_ids:
-        nft_info = get_nft_info(client, nft_id)
+    for nft_info in get_nft_infos(client, nft_ids):
         print(f"NFT ID: {nft_info.nft_id}, Metadata: {nft_info.metadata}")
     
     # Update metadata for specific NFTs by providing their id and serial numbers
@@ -150,8 +142,7 @@ def token_update_nfts():
     
     # Get and print information about the NFTs
     print("\nCheck that only the first NFT has the updated metadata")
-    for nft_id in nft_ids:
-        nft_info = get_nft_info(client, nft_id)
+    for nft_info in get_nft_infos(client, nft_ids):
         print(f"NFT ID: {nft_info.nft_id}, Metadata: {nft_info.metadata}")
     
 if __name__ == "__main__":
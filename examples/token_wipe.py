@@ -1,16 +1,11 @@
 """
-uv run examples/token_wipe.py
-python examples/token_wipe.py
+uv run -m examples.token_wipe
+python -m examples.token_wipe
 """
-import os
 import sys
-from dotenv import load_dotenv
 
 from hiero_sdk_python import (
-    Client,
-    AccountId,
     PrivateKey,
-    Network,
     TransferTransaction,
     TokenAssociateTransaction,
 )
@@ -22,20 +17,7 @@ from hiero_sdk_python.tokens.token_create_transaction import TokenCreateTransact
 from hiero_sdk_python.tokens.token_type import TokenType
 from hiero_sdk_python.tokens.token_wipe_transaction import TokenWipeTransaction
 
-load_dotenv()
-
-def setup_client():
-    """Initialize and set up the client with operator account"""
-    # Initialize network and client
-    network = Network(network='testnet')
-    client = Client(network)
-
-    # Set up operator account
-    operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-    operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-    client.set_operator(operator_id, operator_key)
-    
-    return client, operator_id, operator_key
+from ._shared_client import get_client
 
 def create_test_account(client):
     """Create a new account for testing"""
@@ -167,7 +149,7 @@ def token_wipe():
     4. Transferring tokens to the new account
     5. Wiping the tokens from the account
     """
-    client, operator_id, operator_key = setup_client()
+    client, operator_id, operator_key = get_client()
     account_id, new_account_private_key = create_test_account(client)
     token_id = create_token(client, operator_id, operator_key)
     associate_token(client, account_id, token_id, new_account_private_key)
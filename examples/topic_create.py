@@ -1,30 +1,16 @@
 """
-uv run examples/topic_create.py
-python examples/topic_create.py
+uv run -m examples.topic_create
+python -m examples.topic_create
 
 """
-import os
 import sys
-from dotenv import load_dotenv
 
-from hiero_sdk_python import (
-    Client,
-    AccountId,
-    PrivateKey,
-    TopicCreateTransaction,
-    Network,
-)
+from hiero_sdk_python import TopicCreateTransaction
 
-load_dotenv()
+from ._shared_client import get_client
 
 def create_topic():
-    network = Network(network='testnet')
-    client = Client(network)
-
-    operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-    operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-
-    client.set_operator(operator_id, operator_key)
+    client, _, operator_key = get_client()
 
     transaction = (
         TopicCreateTransaction(
@@ -1,38 +1,17 @@
 """
-uv run examples/topic_message_submit.py
-python examples/topic_message_submit.py
+uv run -m examples.topic_message_submit
+python -m examples.topic_message_submit
 
 """
-import os
 import sys
-from dotenv import load_dotenv
 
 from hiero_sdk_python import (
-    Client,
-    AccountId,
-    PrivateKey,
-    Network,
     TopicMessageSubmitTransaction,
     TopicCreateTransaction,
     ResponseCode
 )
 
-load_dotenv()
-
-def setup_client():
-    """Initialize and set up the client with operator account"""
-    print("Connecting to Hedera testnet...")
-    client = Client(Network(network='testnet'))
-
-    try:
-        operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-        operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-        client.set_operator(operator_id, operator_key)
-
-        return client, operator_id, operator_key
-    except (TypeError, ValueError):
-        print("❌ Error: Creating client, Please check your .env file")
-        sys.exit(1)
+from ._shared_client import get_client
 
 def create_topic(client, operator_key):
     """Create a new topic"""
@@ -61,7 +40,7 @@ def submit_message(message):
     A example to create a topic and then submit a message to it.
     """
     # Config Client
-    client, _, operator_key = setup_client()
+    client, _, operator_key = get_client()
 
     # Create a new Topic
     topic_id = create_topic(client, operator_key)
@@ -1,40 +1,19 @@
 """
-uv run examples/transfer_hbar.py
-python examples/transfer_hbar.py
+uv run -m examples.transfer_hbar
+python -m examples.transfer_hbar
 
 """
-import os
 import sys
-from dotenv import load_dotenv
 
 from hiero_sdk_python import (
-    Client,
-    AccountId,
     PrivateKey,
-    Network,
     TransferTransaction,
     AccountCreateTransaction,
     Hbar,
     CryptoGetAccountBalanceQuery
 )
 
-load_dotenv()
-
-def setup_client():
-    """Initialize and set up the client with operator account"""
-    print("Connecting to Hedera testnet...")
-    client = Client(Network(network='testnet'))
-
-    try:
-        operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-        operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-        client.set_operator(operator_id, operator_key)
-
-        return client, operator_id, operator_key
-    except (TypeError, ValueError):
-        print("❌ Error: Creating client, Please check your .env file")
-        sys.exit(1)
-
+from ._shared_client import get_client
 
 def create_account(client, operator_key):
     """Create a new recipient account"""
@@ -60,7 +39,7 @@ def transfer_hbar():
     A full example to create a new recipent account and transfer hbar to that account
     """
     # Config Client
-    client, operator_id, operator_key = setup_client()
+    client, operator_id, operator_key = get_client()
 
     # Create a new recipient account.
     recipient_id, _ = create_account(client, operator_key)
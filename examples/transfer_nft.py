@@ -1,18 +1,14 @@
 """
-uv run examples/transfer_nft.py
-python examples/transfer_nft.py
+uv run -m examples.transfer_nft
+python -m examples.transfer_nft
 
 """
-import os
 import sys
-from dotenv import load_dotenv
 
 from hiero_sdk_python import (
-    Client,
-    AccountId,
     PrivateKey,
-    Network,
     TransferTransaction,
+    BatchTransaction,
 )
 from hiero_sdk_python.account.account_create_transaction import AccountCreateTransaction
 from hiero_sdk_python.hapi.services.basic_types_pb2 import TokenType
@@ -24,20 +20,7 @@ from hiero_sdk_python.tokens.token_associate_transaction import TokenAssociateTr
 from hiero_sdk_python.tokens.token_create_transaction import TokenCreateTransaction
 from hiero_sdk_python.tokens.token_mint_transaction import TokenMintTransaction
 
-load_dotenv()
-
-def setup_client():
-    """Initialize and set up the client with operator account"""
-    # Initialize network and client
-    network = Network(network='testnet')
-    client = Client(network)
-
-    # Set up operator account
-    operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-    operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-    client.set_operator(operator_id, operator_key)
-    
-    return client, operator_id, operator_key
+from ._shared_client import get_client
 
 def create_test_account(client):
     """Create a new account for testing"""
@@ -97,43 +80,49 @@ def create_nft(client, operator_id, operator_key):
     
     return nft_token_id
 
-def mint_nft(client, nft_token_id, operator_key):
-    """Mint a non-fungible token"""
-    transaction = (
+def mint_nft(client, nft_token_id, batch_key):
+    """Prepare the minting of a non-fungible token for a batch"""
+    # The operator owns the supply key and batchify signs with the operator key
+    return (
         TokenMintTransaction()
         .set_token_id(nft_token_id)
         .set_metadata(b"My NFT Metadata 1")
-        .freeze_with(client)
+        .batchify(client, batch_key)
     )
 
-    receipt = transaction.execute(client)
-    
-    if receipt.status != ResponseCode.SUCCESS:
-        print(f"NFT minting failed with status: {ResponseCode(receipt.status).name}")
-        sys.exit(1)
-    
-    print(f"NFT minted with serial number: {receipt.serial_numbers[0]}")
-    
-    return NftId(nft_token_id, receipt.serial_numbers[0])
-
-def associate_nft(client, account_id, token_id, account_private_key):
-    """Associate a non-fungible token with an account"""
+def associate_nft(client, account_id, token_id, account_private_key, batch_key):
+    """Prepare the association of a non-fungible token with an account for a batch"""
     # Associate the token_id with the new account
-    associate_transaction = (
+    return (
         TokenAssociateTransaction()
         .set_account_id(account_id)
         .add_token_id(token_id)
-        .freeze_with(client)
+        .batchify(client, batch_key)
         .sign(account_private_key) # Has to be signed by new account's key
     )
-    
-    receipt = associate_transaction.execute(client)
-    
+
+def transfer_nft_to_account(client, nft_id, operator_id, account_id, batch_key):
+    """Prepare the transfer of the nft to the new account for a batch"""
+    return (
+        TransferTransaction()
+        .add_nft_transfer(nft_id, operator_id, account_id)
+        .batchify(client, batch_key)
+    )
+
+def mint_associate_and_transfer(client, inner_transactions):
+    """Execute the minting, association and transfer together in one atomic batch"""
+    receipt = (
+        BatchTransaction()
+        .set_inner_transactions(inner_transactions)
+        .freeze_with(client)
+        .sign(client.operator_private_key) # The operator key is the batch key of the inner transactions
+        .execute(client)
+    )
+
+    # Check if the minting, association and transfer were successful
     if receipt.status != ResponseCode.SUCCESS:
-        print(f"NFT association failed with status: {ResponseCode(receipt.status).name}")
+        print(f"NFT minting, association and transfer failed with status: {ResponseCode(receipt.status).name}")
         sys.exit(1)
-    
-    print("NFT successfully associated with account")
 
 def transfer_nft():
     """
@@ -144,26 +133,23 @@ def transfer_nft():
     4. Associating the nft with the new account
     5. Transferring the nft to the new account
     """
-    client, operator_id, operator_key = setup_client()
+    client, operator_id, operator_key = get_client()
     account_id, new_account_private_key = create_test_account(client)
     token_id = create_nft(client, operator_id, operator_key)
-    nft_id = mint_nft(client, token_id, operator_key)
-    associate_nft(client, account_id, token_id, new_account_private_key)
-    
-    # Transfer nft to the new account
-    transfer_transaction = (
-        TransferTransaction()
-        .add_nft_transfer(nft_id, operator_id, account_id)
-        .freeze_with(client)
-    )
-    
-    receipt = transfer_transaction.execute(client)
-    
-    # Check if nft transfer was successful
-    if receipt.status != ResponseCode.SUCCESS:
-        print(f"NFT transfer failed with status: {ResponseCode(receipt.status).name}")
-        sys.exit(1)
-    
+
+    # Minting, associating and transferring the nft go in one atomic batch (HIP-551), so they
+    # need a single round-trip and a single receipt. The inner transactions run in order, and
+    # the first mint of a new collection always gets serial number 1, so the ID of the nft to
+    # transfer is known before the batch is executed.
+    nft_id = NftId(token_id, 1)
+    batch_key = operator_key.public_key()
+    mint_tx = mint_nft(client, token_id, batch_key)
+    associate_tx = associate_nft(client, account_id, token_id, new_account_private_key, batch_key)
+    transfer_tx = transfer_nft_to_account(client, nft_id, operator_id, account_id, batch_key)
+    mint_associate_and_transfer(client, [mint_tx, associate_tx, transfer_tx])
+
+    print(f"NFT minted with serial number: {nft_id.serial_number}")
+    print("NFT successfully associated with account")
     print(f"Successfully transferred NFT to account {account_id}")
 
 if __name__ == "__main__":
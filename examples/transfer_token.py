@@ -1,44 +1,26 @@
 """
-uv run examples/transfer_token.py
-python examples/transfer_token.py
+uv run -m examples.transfer_token
+python -m examples.transfer_token
 
 """
-import os
+import asyncio
 import sys
-from dotenv import load_dotenv
 
 from hiero_sdk_python import (
-    Client,
-    AccountId,
     PrivateKey,
-    Network,
     TransferTransaction,
     AccountCreateTransaction,
     Hbar,
     TokenCreateTransaction,
     CryptoGetAccountBalanceQuery,
-    TokenAssociateTransaction
+    TokenAssociateTransaction,
+    BatchTransaction,
 )
+from hiero_sdk_python.response_code import ResponseCode
 
-load_dotenv()
+from ._shared_client import get_client
 
-def setup_client():
-    """Initialize and set up the client with operator account"""
-    print("Connecting to Hedera testnet...")
-    client = Client(Network(network='testnet'))
-
-    try:
-        operator_id = AccountId.from_string(os.getenv('OPERATOR_ID'))
-        operator_key = PrivateKey.from_string(os.getenv('OPERATOR_KEY'))
-        client.set_operator(operator_id, operator_key)
-
-        return client, operator_id, operator_key
-    except (TypeError, ValueError):
-        print("❌ Error: Creating client, Please check your .env file")
-        sys.exit(1)
-
-
-def create_account(client, operator_key):
+async def create_account(client, operator_key):
     """Create a new recipient account"""
     print("\nSTEP 1: Creating a new recipient account...")
     recipient_key = PrivateKey.generate()
@@ -48,7 +30,7 @@ def create_account(client, operator_key):
             .set_key(recipient_key.public_key())
             .set_initial_balance(Hbar.from_tinybars(100_000_000))
         )
-        receipt = tx.freeze_with(client).sign(operator_key).execute(client)
+        receipt = await tx.freeze_with(client).sign(operator_key).execute_async(client)
         recipient_id = receipt.account_id
         print(f"✅ Success! Created a new recipient account with ID: {recipient_id}")
         return recipient_id, recipient_key
@@ -57,7 +39,7 @@ def create_account(client, operator_key):
         print(f"Error creating new account: {e}")
         sys.exit(1)
 
-def create_token(client, operator_id, operator_key):
+async def create_token(client, operator_id, operator_key):
     print("\nSTEP 2: Creating a new token...")
     try:
         token_tx = (
@@ -69,7 +51,7 @@ def create_token(client, operator_id, operator_key):
             .freeze_with(client)
             .sign(operator_key)
         )
-        token_receipt = token_tx.execute(client)
+        token_receipt = await token_tx.execute_async(client)
         token_id = token_receipt.token_id
 
         print(f"✅ Success! Created a token with Token ID: {token_id}")
@@ -78,60 +60,70 @@ def create_token(client, operator_id, operator_key):
         print(f"❌ Error creating token: {e}")
         sys.exit(1)
 
-def associate_token(client, recipient_id, recipient_key, token_id):
-    print("\nSTEP 3: Associating Token...")
-    try:
-        association_tx = (
-            TokenAssociateTransaction(account_id=recipient_id, token_ids=[token_id])
-            .freeze_with(client)
-            .sign(recipient_key)
-        )
-        association_tx.execute(client)
-
-        print("✅ Success! Token association complete.")
-    except Exception as e:
-        print(f"❌ Error associating token: {e}")
-        sys.exit(1)
-
-def transfer_tokens():
+def associate_token(client, recipient_id, recipient_key, token_id, batch_key):
+    """Prepare the association of the token with the recipient account for a batch"""
+    return (
+        TokenAssociateTransaction(account_id=recipient_id, token_ids=[token_id])
+        .batchify(client, batch_key)
+        .sign(recipient_key)
+    )
+
+def transfer_token(client, operator_id, recipient_id, token_id, batch_key):
+    """Prepare the transfer of the token to the recipient account for a batch"""
+    # batchify signs with the operator key, which owns the sending account
+    return (
+        TransferTransaction()
+        .add_token_transfer(token_id, operator_id, -1)
+        .add_token_transfer(token_id, recipient_id, 1)
+        .batchify(client, batch_key)
+    )
+
+async def transfer_tokens():
     """
     A full example to create a new recipent account, a fungible token, and
     transfer the token to that account
     """
     # Config Client
-    client, operator_id, operator_key = setup_client()
-
-    # Create a new recipient account.
-    recipient_id, recipient_key = create_account(client, operator_key)
-
-    # Create new tokens.
-    token_id = create_token(client, operator_id, operator_key)
-
-    # Associate Token
-    associate_token(client, recipient_id, recipient_key, token_id)
-
-    # Transfer Token
-    print("\nSTEP 4: Transfering Token...")
+    client, operator_id, operator_key = get_client()
+
+    # Create a new recipient account and new tokens. Neither depends on the
+    # other, so both are submitted at the same time.
+    (recipient_id, recipient_key), token_id = await asyncio.gather(
+        create_account(client, operator_key),
+        create_token(client, operator_id, operator_key),
+    )
+
+    # Associate and transfer the token in one atomic batch (HIP-551), so they need a
+    # single round-trip and a single receipt instead of one each.
+    print("\nSTEP 3: Associating and transfering Token...")
     try:
-        # Check balance before transfer
+        # Check balance before transfer. The token is not associated yet, so the
+        # recipient holds none of it.
         balance_before = (
             CryptoGetAccountBalanceQuery(account_id=recipient_id)
             .execute(client)
             .token_balances
         )
         print("Token balance before token transfer:")
-        print(f"{token_id}: {balance_before.get(token_id)}")
-
-        transfer_tx = (
-            TransferTransaction()
-            .add_token_transfer(token_id, operator_id, -1)
-            .add_token_transfer(token_id, recipient_id, 1)
+        print(f"{token_id}: {balance_before.get(token_id, 0)}")
+
+        batch_key = operator_key.public_key()
+        receipt = (
+            BatchTransaction()
+            .set_inner_transactions([
+                associate_token(client, recipient_id, recipient_key, token_id, batch_key),
+                transfer_token(client, operator_id, recipient_id, token_id, batch_key),
+            ])
             .freeze_with(client)
-            .sign(operator_key)
+            .sign(operator_key) # The operator key is the batch key of the inner transactions
+            .execute(client)
         )
-        transfer_tx.execute(client)
-        
-        print("\n✅ Success! Token transfer complete.\n")
+
+        if receipt.status != ResponseCode.SUCCESS:
+            print(f"❌ Token association and transfer failed with status: {ResponseCode(receipt.status).name}")
+            sys.exit(1)
+
+        print("\n✅ Success! Token association and transfer complete.\n")
 
         # Check balance after transfer
         balance_after = (
@@ -142,8 +134,8 @@ def transfer_tokens():
         print("Token balance after token transfer:")
         print(f"{token_id}: {balance_after.get(token_id)}")
     except Exception as e:
-        print(f"❌ Error transferring token: {str(e)}")
+        print(f"❌ Error associating and transferring token: {str(e)}")
         sys.exit(1)
 
 if __name__ == "__main__":
-    transfer_tokens()
+    asyncio.run(transfer_tokens())
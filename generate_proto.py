@@ -26,14 +26,17 @@ Run: python generate_proto.py -vv or with trace logs: python generate_proto.py -
 from __future__ import annotations
 import argparse
 import logging
+import os
 import re
 import shutil
 import sys
 import tarfile
 import tempfile
 import urllib.request
+from collections import deque
 from importlib.resources import files as pkg_files
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List, Set, Tuple
 from urllib.error import URLError
@@ -45,6 +48,11 @@ DEFAULT_HAPI_VERSION = "v0.66.0"
 DEFAULT_PROTOS_DIR = ".protos"
 DEFAULT_OUTPUT = "src/hiero_sdk_python/hapi"
 
+# Top-level directories of the protobufs archive that are kept; everything else is skipped
+PROTO_SOURCE_DIRS = ("platform", "services", "mirror")
+# Read the compressed download in 128 KiB blocks instead of tarfile's 10 KiB default
+TAR_STREAM_BUFSIZE = 128 * 1024
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 
 # -------------------- Config --------------------
@@ -145,14 +153,18 @@ def is_safe_tar_member(member: tarfile.TarInfo, base: Path) -> bool:
         return False
     return True
 
-def safe_extract_tar_stream(response, dest: Path) -> None:
-    """Stream-extract a GitHub tgz, stripping the top-level folder safely."""
-    with tarfile.open(fileobj=response, mode="r|gz") as tar:
+def safe_extract_tar_stream(response, dest: Path, keep: Iterable[str] = PROTO_SOURCE_DIRS) -> None:
+    """
+    Stream-extract a GitHub tgz, stripping the top-level folder safely.
+    Only members under the `keep` top-level directories are written.
+    """
+    keep = set(keep)
+    with tarfile.open(fileobj=response, mode="r|gz", bufsize=TAR_STREAM_BUFSIZE) as tar:
         for member in tar:
             parts = Path(member.name).parts
-            member.name = "/".join(parts[1:]) if len(parts) > 1 else ""
-            if not member.name:
+            if len(parts) < 2 or parts[1] not in keep:
                 continue
+            member.name = "/".join(parts[1:])
             if not is_safe_tar_member(member, dest):
                 raise RuntimeError(f"Unsafe path in archive: {member.name}")
             tar.extract(member, path=dest)  # nosec B202 - path validated by is_safe_tar_member
@@ -186,11 +198,6 @@ def download_and_setup_protos(hapi_version: str, protos_dir: Path) -> None:
     except (tarfile.TarError, OSError) as e:
         raise RuntimeError(f"Failed to extract protobuf files: {e}") from e
 
-    # Keep only platform, services, mirror
-    for item in list(protos_dir.iterdir()):
-        if item.is_dir() and item.name not in {"platform", "services", "mirror"}:
-            shutil.rmtree(item)
-
     logging.info("Protobufs ready at %s", protos_dir)
 
 # -------------------- Filesystem helpers --------------------
@@ -212,14 +219,22 @@ def ensure_subpackages(base: Path, subdirs: Iterable[Path]) -> None:
         (base / p).mkdir(parents=True, exist_ok=True)
 
 def create_init_files(*roots: Path) -> None:
+    # os.walk lists directories from the scandir entry types, so generated files are never stat'd
     for root in roots:
-        for p in [root, *root.rglob("*")]:
-            if p.is_dir():
-                (p / "__init__.py").touch(exist_ok=True)
+        for dirpath, _dirnames, _filenames in os.walk(root):
+            (Path(dirpath) / "__init__.py").touch(exist_ok=True)
 
 def log_generated_files(output_dir: Path) -> None:
-    py_files  = sorted(output_dir.rglob("*.py"))
-    pyi_files = sorted(output_dir.rglob("*.pyi"))
+    # One walk of the output tree, split by suffix
+    py_files: list[Path] = []
+    pyi_files: list[Path] = []
+    for p in output_dir.rglob("*"):
+        if p.suffix == ".py":
+            py_files.append(p)
+        elif p.suffix == ".pyi":
+            pyi_files.append(p)
+    py_files.sort()
+    pyi_files.sort()
 
     print(f"\n📂 Generated compiled proto files in {output_dir}:")
     print(f"   {len(py_files)} Python files, {len(pyi_files)} stub files")
@@ -244,6 +259,11 @@ def log_generated_files(output_dir: Path) -> None:
             logging.trace("  - %s", rel)
 
 # -------------------- Protoc invocation --------------------
+@lru_cache(maxsize=1)
+def google_include() -> str:
+    """Path of the google/protobuf well-known types bundled with grpc_tools."""
+    return str(pkg_files("grpc_tools").joinpath("_proto"))
+
 def run_protoc(
     proto_paths: List[Path],
     out_py: Path,
@@ -255,12 +275,10 @@ def run_protoc(
         logging.info("No .proto files to compile (skipping).")
         return
 
-    google_include = str(pkg_files("grpc_tools").joinpath("_proto"))
-
     args: list[str] = ["protoc"]
     for pp in proto_paths:
         args += ["-I", pp.as_posix()]
-    args += ["-I", google_include]
+    args += ["-I", google_include()]
 
     args += ["--python_out", str(out_py), "--grpc_python_out", str(out_grpc)]
     if pyi_out:
@@ -276,94 +294,91 @@ def run_protoc(
 
 # -------------------- Import normalization for .proto --------------------
 
-def rewrite_import_line(line: str, src_root: Path) -> str:
+# Matches a whole 'import "...";' statement at the start of any line of a .proto file
+_RX_PROTO_IMPORT = re.compile(r'^([ \t]*import[ \t]+")([^"]+)("[ \t]*;)', re.MULTILINE)
+
+def index_protos(src_root: Path) -> Set[Path]:
+    """Return the relative paths of every .proto under src_root, listed once."""
+    return {p.relative_to(src_root) for p in src_root.rglob("*.proto")}
+
+def canonical_import_target(target: str, known: Set[Path]) -> str:
     """
-    Normalize an 'import "..."' line to a canonical path:
+    Normalize an import target to a canonical path:
       - leave google/ imports
       - event/...  -> platform/event/...
       - unqualified X.proto -> services/X.proto if exists, else platform/X.proto
     """
-    m = re.match(r'\s*import\s+"([^"]+)"\s*;', line)
-    if not m:
-        return line
-    target = m.group(1)
-
     # Already qualified or google include
     if target.startswith(("google/", "services/", "platform/", "mirror/")):
-        return line
+        return target
 
     if target.startswith("event/"):
-        return line.replace(target, f"platform/{target}")
+        return f"platform/{target}"
 
     if "/" not in target:
-        if (src_root / "services" / target).exists():
-            return line.replace(target, f"services/{target}")
-        if (src_root / "platform" / target).exists():
-            return line.replace(target, f"platform/{target}")
-
-    return line
-
-def parse_import_line(line: str, src_root: Path) -> tuple[str, Path | None]:
-    """Return (possibly rewritten) line and a dependency Path (or None)."""
-    if "import " not in line or ".proto" not in line:
-        return line, None
-    new_line = rewrite_import_line(line, src_root)
-    m = re.match(r'\s*import\s+"([^"]+)"\s*;', new_line)
-    if not m:
-        return new_line, None
-    target = m.group(1)
-    if target.startswith("google/"):
-        return new_line, None
-    dep_rel = Path(target)
-    return (new_line, dep_rel if (src_root / dep_rel).exists() else None)
+        if Path("services", target) in known:
+            return f"services/{target}"
+        if Path("platform", target) in known:
+            return f"platform/{target}"
+
+    return target
+
+def normalize_proto_text(text: str, known: Set[Path]) -> Tuple[str, List[Path]]:
+    """Return the proto text with imports normalized, and its (non-google) dependencies."""
+    deps: list[Path] = []
+
+    def repl(m: re.Match) -> str:
+        target = canonical_import_target(m.group(2), known)
+        dep_rel = Path(target)
+        if not target.startswith("google/") and dep_rel in known:
+            deps.append(dep_rel)
+        return f"{m.group(1)}{target}{m.group(3)}"
+
+    return _RX_PROTO_IMPORT.sub(repl, text), deps
 
 
 def collect_and_normalize(
     src_root: Path,
-    rel: Path,
+    files: Iterable[Path],
     visited: Set[Path],
     tmp_root: Path,
+    known: Set[Path],
 ) -> None:
     """
-    Recursively copy `rel` into tmp_root and normalize its imports; follow deps.
+    Walk `files` and their deps, writing a normalized copy into tmp_root only for
+    protos whose imports had to be rewritten.
     """
-    if rel in visited:
-        return
-    visited.add(rel)
-
-    src = src_root / rel
-    if not src.exists():
-        return
-
-    dst = tmp_root / rel
-    dst.parent.mkdir(parents=True, exist_ok=True)
+    queue = deque(files)
+    while queue:
+        rel = queue.popleft()
+        if rel in visited:
+            continue
+        visited.add(rel)
 
-    deps: list[Path] = []
-    lines = src.read_text(encoding="utf-8").splitlines(True)
-    out_lines: list[str] = []
+        if rel not in known:
+            continue
 
-    for line in lines:
-        new_line, dep = parse_import_line(line, src_root)
-        out_lines.append(new_line)
-        if dep is not None:
-            deps.append(dep)
+        text = (src_root / rel).read_text(encoding="utf-8")
+        new_text, deps = normalize_proto_text(text, known)
 
-    dst.write_text("".join(out_lines), encoding="utf-8")
+        # Already canonical protos are read by protoc straight from src_root
+        if new_text != text:
+            dst = tmp_root / rel
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            dst.write_text(new_text, encoding="utf-8")
 
-    for d in deps:
-        collect_and_normalize(src_root, d, visited, tmp_root)
+        queue.extend(deps)
 
 
 def normalize_tree(src_root: Path, files: List[Path]) -> Tuple[Path, List[Path]]:
     """
-    Build a temp tree containing `files` and their imported deps (non-google),
-    with imports normalized to a single canonical path.
-    Returns (temp_root, relative_paths_in_temp_for_original_files).
+    Build a temp tree holding normalized copies of the `files` and imported deps
+    (non-google) whose imports are not already canonical. Pass it to protoc before
+    src_root so the copies shadow their originals.
+    Returns (temp_root, relative_paths_of_original_files).
     """
     tmp = Path(tempfile.mkdtemp(prefix="protos_norm_"))
-    visited: Set[Path] = set()
-    for rel in files:
-        collect_and_normalize(src_root, rel, visited, tmp)
+    collect_and_normalize(src_root, files, set(), tmp, index_protos(src_root))
     return tmp, files
 
 
@@ -409,7 +424,7 @@ def compile_services_and_platform(protos_root: Path, services_out: Path, pyi_out
     temp_root, norm_rel_files = normalize_tree(protos_root, rel_files)
     try:
         run_protoc(
-            proto_paths=[temp_root],
+            proto_paths=[temp_root, protos_root],
             out_py=services_out,
             out_grpc=services_out,
             files=norm_rel_files,
@@ -425,7 +440,7 @@ def compile_mirror(protos_root: Path, mirror_out: Path) -> None:
     temp_root, norm_rel_files = normalize_tree(protos_root, rel_files)
     try:
         run_protoc(
-            proto_paths=[temp_root],
+            proto_paths=[temp_root, protos_root],
             out_py=mirror_out,
             out_grpc=mirror_out,
             files=norm_rel_files,
@@ -461,14 +476,15 @@ _RX_FROM_MIRROR_AS           = re.compile(r"^\s*from\s+mirror\s+import\s+(\w+_pb
 _RX_FROM_SERVICES_AS_MIR     = re.compile(r"^\s*from\s+services\s+import\s+(\w+_pb2)\s+as", re.MULTILINE)
 _RX_FROM_DOT_AS_MIR          = re.compile(r"^\s*from\s+\.\s+import\s+(\w+_pb2)\s+as", re.MULTILINE)
 
+_RX_PE_FROM_SERVICES         = re.compile(r"^\s*from\s+services\s+import\s+(\w+_pb2)(\s+as\s+\w+)?", re.MULTILINE)
+_RX_PE_FROM_SERVICES_SUBPKG  = re.compile(r"^\s*from\s+services\.((?:\w+\.)*\w+)\s+import\s+(\w+_pb2)(\s+as\s+\w+)?", re.MULTILINE)
+_RX_PE_FROM_PLATFORM_EVENT   = re.compile(r"^\s*from\s+platform\.event\s+import\s+(\w+_pb2)(\s+as\s+\w+)?", re.MULTILINE)
+_RX_PE_FROM_EVENT            = re.compile(r"^\s*from\s+event\s+import\s+(\w+_pb2)(\s+as\s+\w+)?", re.MULTILINE)
+
 def _walk_and_rewrite(root: Path, rewriter) -> tuple[int, int]:
     """Walk .py and .pyi under root, rewrite with `rewriter(text, path) -> new_text|None`."""
     total = changed = 0
-    for py in root.rglob("*"):
-        if not py.is_file():
-            continue
-        if py.suffix not in (".py", ".pyi"):
-            continue
+    for py in _iter_py_like(root):
         if py.name in {"__init__.py", "__init__.pyi"}:
             continue
         total += 1
@@ -560,17 +576,13 @@ def _rewrite_platform_event(text: str, _path: Path) -> str | None:
     s = text
     s2 = s
     # from services import X_pb2 [as Y] -> from ...services import X_pb2 [as Y]
-    s2 = re.sub(r'(?m)^\s*from\s+services\s+import\s+(\w+_pb2)(\s+as\s+\w+)?',
-                r'from ...services import \1\2', s2)
+    s2 = _RX_PE_FROM_SERVICES.sub(r'from ...services import \1\2', s2)
     # from services.foo.bar import X_pb2 [as Y] -> from ...services.foo.bar import X_pb2 [as Y]
-    s2 = re.sub(r'(?m)^\s*from\s+services\.((?:\w+\.)*\w+)\s+import\s+(\w+_pb2)(\s+as\s+\w+)?',
-                r'from ...services.\1 import \2\3', s2)
+    s2 = _RX_PE_FROM_SERVICES_SUBPKG.sub(r'from ...services.\1 import \2\3', s2)
     # from platform.event import X_pb2 [as Y] -> from . import X_pb2 [as Y]
-    s2 = re.sub(r'(?m)^\s*from\s+platform\.event\s+import\s+(\w+_pb2)(\s+as\s+\w+)?',
-                r'from . import \1\2', s2)
+    s2 = _RX_PE_FROM_PLATFORM_EVENT.sub(r'from . import \1\2', s2)
     # (rare) from event import X_pb2 [as Y] -> from . import X_pb2 [as Y]
-    s2 = re.sub(r'(?m)^\s*from\s+event\s+import\s+(\w+_pb2)(\s+as\s+\w+)?',
-                r'from . import \1\2', s2)
+    s2 = _RX_PE_FROM_EVENT.sub(r'from . import \1\2', s2)
     return None if s2 == s else s2
 
 def adjust_python_imports(services_dir: Path, mirror_dir: Path) -> None:
@@ -53,6 +53,7 @@ from .transaction.transaction_id import TransactionId
 from .transaction.transaction_receipt import TransactionReceipt
 from .transaction.transaction_response import TransactionResponse
 from .transaction.transaction_record import TransactionRecord
+from .transaction.batch_transaction import BatchTransaction
 
 # Response / Codes
 from .response_code import ResponseCode
@@ -191,6 +192,7 @@ __all__ = [
     "TransactionReceipt",
     "TransactionResponse",
     "TransactionRecord",
+    "BatchTransaction",
 
     # Response
     "ResponseCode",
@@ -22,6 +22,10 @@ class AccountId:
     - The alias format is `<shardNum>.<realmNum>.<alias>`, where `alias` is the public key
     """
 
+    # Account IDs are held in large numbers as dict keys (transfers, balances),
+    # so instances carry no per-object __dict__
+    __slots__ = ("shard", "realm", "num", "alias_key")
+
     def __init__(
         self, shard: int = 0, realm: int = 0, num: int = 0, alias_key: PublicKey = None
     ) -> None:
@@ -3,7 +3,8 @@ Client module for interacting with the Hedera network.
 """
 
 from collections import namedtuple
-from typing import List, Union
+from concurrent.futures import Executor
+from typing import List, Optional, Union
 
 import grpc
 
@@ -15,6 +16,7 @@ from hiero_sdk_python.hapi.mirror import (
 from hiero_sdk_python.transaction.transaction_id import TransactionId
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.node import _GRPC_CHANNEL_OPTIONS
 
 from .network import Network
 
@@ -24,10 +26,14 @@ class Client:
     """
     Client to interact with Hedera network services including mirror nodes and transactions.
     """
-    def __init__(self, network: Network = None) -> None:
+    def __init__(self, network: Network = None, executor: Optional[Executor] = None) -> None:
         """
         Initializes the Client with a given network configuration.
         If no network is provided, it defaults to a new Network instance.
+
+        An optional executor runs the blocking calls behind `execute_async()`.
+        If none is given, the running event loop's default executor is used,
+        which is shared by every client on that loop.
         """
         self.operator_account_id: AccountId = None
         self.operator_private_key: PrivateKey = None
@@ -41,6 +47,8 @@ class Client:
 
         self.max_attempts: int = 10
 
+        self.executor: Optional[Executor] = executor
+
         self._init_mirror_stub()
 
         self.logger: Logger = Logger(LogLevel.from_env(), "hiero_sdk_python")
@@ -51,7 +59,9 @@ class Client:
         We now use self.network.get_mirror_address() for a configurable mirror address.
         """
         mirror_address = self.network.get_mirror_address()
-        self.mirror_channel = grpc.secure_channel(mirror_address, grpc.ssl_channel_credentials())
+        self.mirror_channel = grpc.secure_channel(
+            mirror_address, grpc.ssl_channel_credentials(), options=_GRPC_CHANNEL_OPTIONS
+        )
         self.mirror_stub = mirror_consensus_grpc.ConsensusServiceStub(self.mirror_channel)
 
     def set_operator(self, account_id: AccountId, private_key: PrivateKey) -> None:
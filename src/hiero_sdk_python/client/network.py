@@ -1,5 +1,6 @@
 """Network module for managing Hedera SDK connections."""
 import secrets
+import threading
 from typing import Dict, List, Optional, Any
 
 import requests
@@ -111,6 +112,10 @@ class Network:
 
         self._node_index: int = secrets.randbelow(len(self.nodes))
         self.current_node: _Node = self.nodes[self._node_index]
+        # The node that completed the most recent request, see _select_request_node()
+        self._last_served_node: Optional[_Node] = None
+        # Guards the round-robin state above, requests may be executed from several threads
+        self._lock = threading.Lock()
 
     def _fetch_nodes_from_mirror_node(self) -> List[_Node]:
         """
@@ -153,12 +158,17 @@ class Network:
             nodes.append(_Node(node[1], node[0], None))
         return nodes
 
-    def _select_node(self) -> _Node:
+    def _select_node(self, node_account_ids: Optional[List[AccountId]] = None) -> _Node:
         """
         Select the next node in the collection of available nodes using round-robin selection.
         
         This method increments the internal node index, wrapping around when reaching the end
         of the node list, and updates the current_node reference.
+
+        Args:
+            node_account_ids (List[AccountId], optional): The nodes the request may be sent to.
+                If the round-robin node is not one of them, the first of them in the network
+                is returned instead.
         
         Raises:
             ValueError: If no nodes are available for selection.
@@ -166,12 +176,61 @@ class Network:
         Returns:
             _Node: The selected node instance.
         """
+        with self._lock:
+            return self._restrict_node(self._advance_node(), node_account_ids)
+
+    def _select_request_node(self, node_account_ids: Optional[List[AccountId]] = None) -> _Node:
+        """
+        Select the node a new request starts on.
+
+        Once the current node has completed a request, the next request starts on the
+        next node, so consecutive requests are spread round-robin across the network
+        instead of queueing behind one node's throttle.
+
+        Args:
+            node_account_ids (List[AccountId], optional): The nodes the request may be sent to,
+                see _select_node().
+
+        Returns:
+            _Node: The node to send the request to first.
+        """
+        with self._lock:
+            node = self.current_node
+            if node is self._last_served_node:
+                next_node = self.nodes[(self._node_index + 1) % len(self.nodes)]
+                # A request restricted to other nodes does not take the next node's turn
+                if not node_account_ids or next_node._account_id in node_account_ids:
+                    node = self._advance_node()
+            return self._restrict_node(node, node_account_ids)
+
+    def _set_last_served_node(self, node: _Node) -> None:
+        """
+        Record the node that completed a request, see _select_request_node().
+        """
+        with self._lock:
+            self._last_served_node = node
+
+    def _advance_node(self) -> _Node:
+        """
+        Move current_node to the next node. The caller must hold the lock.
+        """
         if not self.nodes:
             raise ValueError("No nodes available to select.")
         self._node_index = (self._node_index + 1) % len(self.nodes)
         self.current_node = self.nodes[self._node_index]
         return self.current_node
 
+    def _restrict_node(self, node: _Node, node_account_ids: Optional[List[AccountId]]) -> _Node:
+        """
+        Return node if the request may be sent to it, otherwise the first allowed node.
+        """
+        if not node_account_ids or node._account_id in node_account_ids:
+            return node
+        for candidate in self.nodes:
+            if candidate._account_id in node_account_ids:
+                return candidate
+        raise ValueError(f"None of the nodes {node_account_ids} are in the network.")
+
     def get_mirror_address(self) -> str:
         """
         Return the configured mirror node address used for mirror queries.
@@ -18,6 +18,9 @@ class TopicId:
     This class provides convenient methods for converting between Python objects,
     protobuf `TopicID` instances, and string formats.
     """
+
+    __slots__ = ("shard", "realm", "num")
+
     def __init__(self, shard: int = 0, realm: int = 0, num: int = 0) -> None:
         """
         Initializes a new instance of the TopicId class.
@@ -9,6 +9,7 @@ from hiero_sdk_python.crypto.public_key import PublicKey
 from hiero_sdk_python.utils.crypto_utils import keccak256
 
 _LEGACY_ECDSA_PRIVATE_KEY_PREFIX = "3030020100300706052b8104000a04220420"
+_LEGACY_ECDSA_PRIVATE_KEY_PREFIX_BYTES = bytes.fromhex(_LEGACY_ECDSA_PRIVATE_KEY_PREFIX)
 
 
 class PrivateKey:
@@ -28,6 +29,7 @@ class PrivateKey:
         self._private_key: Union[
             ec.EllipticCurvePrivateKey, ed25519.Ed25519PrivateKey
         ] = private_key
+        self._public_key: Optional[PublicKey] = None
 
     #
     # ---------------------------------
@@ -205,10 +207,11 @@ class PrivateKey:
         Auto-detect Ed25519 vs. ECDSA(secp256k1). Return None on failure.
         """
         # Try to parse the key as a legacy ECDSA key first
-        try:
-            return PrivateKey._parse_legacy_ecdsa_der_key(key_bytes)
-        except Exception:
-            pass
+        if PrivateKey._has_legacy_ecdsa_prefix(key_bytes):
+            try:
+                return PrivateKey._parse_legacy_ecdsa_der_key(key_bytes)
+            except Exception:
+                pass
 
         try:
             private_key = serialization.load_der_private_key(key_bytes, password=None)
@@ -259,11 +262,12 @@ class PrivateKey:
         Auto-detect Ed25519 vs. ECDSA(secp256k1).
         """
         # Try to parse the key as a legacy ECDSA key first
-        try:
-            private_key = PrivateKey._parse_legacy_ecdsa_der_key(der_data)
-            return cls(private_key)
-        except Exception:
-            pass
+        if PrivateKey._has_legacy_ecdsa_prefix(der_data):
+            try:
+                private_key = PrivateKey._parse_legacy_ecdsa_der_key(der_data)
+                return cls(private_key)
+            except Exception:
+                pass
 
         try:
             private_key = serialization.load_der_private_key(der_data, password=None)
@@ -296,7 +300,14 @@ class PrivateKey:
             # Ed25519 automatically handles the hashing internally
             return self._private_key.sign(data)
         
-        data_hash = keccak256(data)
+        return self._sign_ecdsa_digest(keccak256(data))
+
+    def _sign_ecdsa_digest(self, data_hash: bytes) -> bytes:
+        """
+        Sign the Keccak-256 digest of the data with this ECDSA key.
+
+        Lets callers that sign the same data with several keys hash it only once.
+        """
         signature_der = self._private_key.sign(data_hash, ec.ECDSA(asym_utils.Prehashed(hashes.SHA256())))
         r, s = asym_utils.decode_dss_signature(signature_der)
         signature = r.to_bytes(32, "big") + s.to_bytes(32, "big")
@@ -305,8 +316,12 @@ class PrivateKey:
     def public_key(self) -> PublicKey:
         """
         Derive the public key from this private key.
+
+        The key is derived once and the same PublicKey is returned on later calls.
         """
-        return PublicKey(self._private_key.public_key())
+        if self._public_key is None:
+            self._public_key = PublicKey(self._private_key.public_key())
+        return self._public_key
 
 
     #
@@ -425,6 +440,15 @@ class PrivateKey:
     # Helper methods
     # ---------------------------------
     #
+    @staticmethod
+    def _has_legacy_ecdsa_prefix(key_bytes: bytes) -> bool:
+        """
+        Check whether the bytes start with the legacy ECDSA DER prefix.
+
+        Lets the DER loaders skip the legacy parser (and its exception) for regular keys.
+        """
+        return key_bytes.startswith(_LEGACY_ECDSA_PRIVATE_KEY_PREFIX_BYTES)
+
     @staticmethod
     def _parse_legacy_ecdsa_der_key(key_bytes: bytes) -> "ec.EllipticCurvePrivateKey":
         """
@@ -441,18 +465,11 @@ class PrivateKey:
         Raises:
             ValueError: If the key format is invalid or parsing fails
         """
-        if not key_bytes.hex().startswith(_LEGACY_ECDSA_PRIVATE_KEY_PREFIX):
+        if not PrivateKey._has_legacy_ecdsa_prefix(key_bytes):
             raise ValueError("Missing legacy ECDSA prefix")
 
         # Remove the legacy prefix
-        hex_without_prefix = key_bytes.hex().removeprefix(
-            _LEGACY_ECDSA_PRIVATE_KEY_PREFIX
-        )
-
-        try:
-            raw_key_bytes = bytes.fromhex(hex_without_prefix)
-        except ValueError as exc:
-            raise ValueError("Invalid hex data after prefix removal") from exc
+        raw_key_bytes = key_bytes[len(_LEGACY_ECDSA_PRIVATE_KEY_PREFIX_BYTES):]
 
         # ECDSA private keys must be exactly 32 bytes
         if len(raw_key_bytes) != 32:
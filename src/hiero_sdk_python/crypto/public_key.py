@@ -1,6 +1,6 @@
 """This module handles Public key operations"""
 import warnings
-from typing import Union
+from typing import Optional, Union
 
 from cryptography.hazmat.primitives.asymmetric import ed25519, ec
 from cryptography.hazmat.primitives import serialization, hashes
@@ -34,6 +34,7 @@ class PublicKey:
         Initializes a PublicKey from a cryptography PublicKey object.
         """
         self._public_key: Union[ec.EllipticCurvePublicKey, ed25519.Ed25519PublicKey] = public_key
+        self._raw_bytes: Optional[bytes] = None
 
     #
     # ---------------------------------
@@ -387,10 +388,14 @@ class PublicKey:
             - If `is_ed25519() == True`, a 32-byte Ed25519 point.  
             - Otherwise, a 33-byte compressed secp256k1 point.
         """
-        if self.is_ed25519():
-            return self.to_bytes_ed25519()
-        # ECDSA
-        return self.to_bytes_ecdsa()
+        # Encoded once; signing and key conversion ask for these bytes repeatedly
+        if self._raw_bytes is None:
+            if self.is_ed25519():
+                self._raw_bytes = self.to_bytes_ed25519()
+            else:
+                # ECDSA
+                self._raw_bytes = self.to_bytes_ecdsa()
+        return self._raw_bytes
 
     def to_bytes_ed25519(self) -> bytes:
         """
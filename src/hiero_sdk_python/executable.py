@@ -10,6 +10,12 @@ from hiero_sdk_python.exceptions import MaxAttemptsError
 if TYPE_CHECKING:
     from hiero_sdk_python.client.client import Client
 
+# gRPC status codes after which a node's channel is replaced by a new one on next use
+_RECYCLE_CHANNEL_STATUS_CODES = frozenset({
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+})
+
 # Default values for retry and backoff configuration in miliseconds
 DEFAULT_MAX_BACKOFF: int = 8000
 DEFAULT_MIN_BACKOFF: int = 250
@@ -168,22 +174,29 @@ class _Executable(ABC):
         err_persistant = None
         
         tx_id = self.transaction_id if hasattr(self, "transaction_id") else None
+        # Queries may be restricted to specific nodes, e.g. a receipt query to the node
+        # the transaction was submitted to
+        node_account_ids = self.node_account_ids if hasattr(self, "node_account_ids") else None
         
         logger = client.logger
+        # Formatted once so every log line of this execution shares the same request ID
+        request_id = self._get_request_id()
+
+        # The node is kept local to this execution, other threads may select nodes concurrently
+        node = client.network._select_request_node(node_account_ids)
         
         for attempt in range(max_attempts):
             # Exponential backoff for retries
             if attempt > 0 and current_backoff < self._max_backoff:
                 current_backoff *= 2
                         
-            # Set the node account id to the client's node account id
-            node = client.network.current_node
+            # Set the node account id to the selected node's account id
             self.node_account_id = node._account_id
   
             # Create a channel wrapper from the client's channel
             channel = node._get_channel()
             
-            logger.trace("Executing", "requestId", self._get_request_id(), "nodeAccountID", self.node_account_id, "attempt", attempt + 1, "maxAttempts", max_attempts)
+            logger.trace("Executing", "requestId", request_id, "nodeAccountID", self.node_account_id, "attempt", attempt + 1, "maxAttempts", max_attempts)
 
             # Get the appropriate gRPC method to call
             method = self._get_method(channel)
@@ -192,7 +205,7 @@ class _Executable(ABC):
             proto_request = self._make_request()
 
             try:
-                logger.trace("Executing gRPC call", "requestId", self._get_request_id())
+                logger.trace("Executing gRPC call", "requestId", request_id)
                 
                 # Execute the transaction method with the protobuf request
                 response = _execute_method(method, proto_request)
@@ -203,14 +216,14 @@ class _Executable(ABC):
                 # Determine if we should retry based on the response
                 execution_state = self._should_retry(response)
                 
-                logger.trace(f"{self.__class__.__name__} status received", "nodeAccountID", self.node_account_id, "network", client.network.network, "state", execution_state.name, "txID", tx_id)
+                logger.trace(f"{self.__class__.__name__} status received", "requestId", request_id, "nodeAccountID", self.node_account_id, "network", client.network.network, "state", execution_state.name, "txID", tx_id)
                 
                 # Handle the execution state
                 match execution_state:
                     case _ExecutionState.RETRY:
                         # If we should retry, wait for the backoff period and try again
                         err_persistant = status_error
-                        _delay_for_attempt(self._get_request_id(), current_backoff, attempt, logger, err_persistant)
+                        _delay_for_attempt(request_id, current_backoff, attempt, logger, err_persistant)
                         continue
                     case _ExecutionState.EXPIRED:
                         raise status_error
@@ -218,16 +231,22 @@ class _Executable(ABC):
                         raise status_error
                     case _ExecutionState.FINISHED:
                         # If the transaction completed successfully, map the response and return it
-                        logger.trace(f"{self.__class__.__name__} finished execution")
+                        logger.trace(f"{self.__class__.__name__} finished execution", "requestId", request_id)
+                        client.network._set_last_served_node(node)
                         return self._map_response(response, self.node_account_id, proto_request)
             except grpc.RpcError as e:
                 # Save the error
                 err_persistant = f"Status: {e.code()}, Details: {e.details()}"
-                node = client.network._select_node()
+                # Replace a channel that failed at the transport level so a new one is opened on
+                # the next use instead of waiting out gRPC's reconnect backoff. It is not closed,
+                # calls of other threads may still be in flight on it
+                if e.code() in _RECYCLE_CHANNEL_STATUS_CODES:
+                    node._mark_channel_stale(channel)
+                node = client.network._select_node(node_account_ids)
                 logger.trace("Switched to a different node for the next attempt", "error", err_persistant, "from node", self.node_account_id, "to node", node._account_id)
                 continue
             
-        logger.error("Exceeded maximum attempts for request", "requestId", self._get_request_id(), "last exception being", err_persistant)
+        logger.error("Exceeded maximum attempts for request", "requestId", request_id, "last exception being", err_persistant)
         
         raise MaxAttemptsError("Exceeded maximum attempts for request", self.node_account_id, err_persistant)
 
@@ -240,7 +259,7 @@ def _delay_for_attempt(request_id: str, current_backoff: int, attempt: int, logg
         attempt (int): The current attempt number (0-based)
         current_backoff (int): The current backoff period in milliseconds
     """
-    logger.trace(f"Retrying request attempt", "requestId", request_id, "delay", current_backoff, "attempt", attempt, "error", error)
+    logger.trace("Retrying request attempt", "requestId", request_id, "delay", current_backoff, "attempt", attempt, "error", error)
     time.sleep(current_backoff * 0.001)
 
 def _execute_method(method, proto_request):
@@ -340,6 +340,7 @@ class FileAppendTransaction(Transaction):
             # Clear the frozen state to allow rebuilding with new transaction ID
             self._transaction_body_bytes.clear()
             self._signature_map.clear()
+            self._signed_transaction_bytes.clear()
 
             # Freeze the transaction for this chunk if not already frozen
             self.freeze_with(client)
@@ -350,12 +351,30 @@ class FileAppendTransaction(Transaction):
                 super().sign(signing_key)
 
 
-            # Execute the chunk
-            response = super().execute(client)
+            # Execute the chunk. submit() is overridden to reject multi-chunk contents,
+            # so the chunk goes through the parent's submit directly
+            response = super().submit(client).get_receipt(client)
             responses.append(response)
 
-            # Return the first response (as per JavaScript implementation)
-            return responses[0] if responses else None
+        # Return the first response (as per JavaScript implementation)
+        return responses[0] if responses else None
+
+    def submit(self, client):
+        """
+        Submits a single-chunk file append transaction without waiting for its receipt.
+
+        Args:
+            client: The client to submit the transaction with.
+
+        Returns:
+            TransactionResponse: The response of the node that accepted the transaction.
+
+        Raises:
+            ValueError: If the contents need more than one chunk; use execute() instead.
+        """
+        if self.get_required_chunks() > 1:
+            raise ValueError("Multi-chunk FileAppendTransaction must be sent with execute().")
+        return super().submit(client)
 
     def sign(self, private_key):
         """
@@ -6,6 +6,14 @@ from hiero_sdk_python.channels import _Channel
 from hiero_sdk_python.address_book.node_address import NodeAddress
 from hiero_sdk_python.managed_node_address import _ManagedNodeAddress
 
+# Detect a dead HTTP/2 connection to a node while calls are in flight. Pings are not
+# sent more often than gRPC servers accept by default (every 5 minutes), nor on idle
+# connections, otherwise the server closes the connection with GOAWAY too_many_pings.
+_GRPC_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 300_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+]
+
 class _Node:
     
     def __init__(self, account_id: AccountId, address: str, address_book: NodeAddress):
@@ -34,6 +42,23 @@ class _Node:
             self._channel.channel.close()
             self._channel = None
 
+    def _mark_channel_stale(self, channel: _Channel):
+        """
+        Stop handing out the given channel, so the next _get_channel() opens a new one.
+
+        The stale channel is not closed, other threads may still have calls in flight on it.
+        It is closed by gRPC once the last of them drops its reference.
+
+        Args:
+            channel (_Channel): The channel a call failed on.
+
+        Returns:
+            None
+        """
+        # Another thread may already have replaced the channel, keep the new one
+        if self._channel is channel:
+            self._channel = None
+
     def _get_channel(self):
         """
         Get the channel for this node.
@@ -45,9 +70,9 @@ class _Node:
             return self._channel
         
         if self._address._is_transport_security():
-            channel = grpc.secure_channel(str(self._address))
+            channel = grpc.secure_channel(str(self._address), options=_GRPC_CHANNEL_OPTIONS)
         else:
-            channel = grpc.insecure_channel(str(self._address))
+            channel = grpc.insecure_channel(str(self._address), options=_GRPC_CHANNEL_OPTIONS)
         
         self._channel = _Channel(channel)
         
@@ -2,6 +2,7 @@
 Base class for all network queries.
 """
 
+import asyncio
 import time
 from typing import Any, List, Optional, Union
 
@@ -93,6 +94,42 @@ class Query(_Executable):
         self.payment_amount = payment_amount
         return self
 
+    def set_node_account_ids(self, node_account_ids: List[AccountId]) -> "Query":
+        """
+        Sets the nodes this query may be sent to.
+
+        If not set, the query may be sent to any node of the client's network.
+
+        Args:
+            node_account_ids (List[AccountId]): The account IDs of the nodes
+
+        Returns:
+            Query: The current query instance for method chaining
+        """
+        self.node_account_ids = list(node_account_ids)
+        return self
+
+    async def execute_async(self, client: Client) -> Any:
+        """
+        Executes the query without blocking the running event loop.
+
+        The blocking gRPC round-trips of `execute()` run in a worker thread of the client's
+        executor (or the event loop's default one), so independent queries can be awaited
+        together, e.g. with `asyncio.gather()`.
+
+        Args:
+            client (Client): The client instance to use for execution
+
+        Returns:
+            The result of the subclass's `execute()`
+
+        Raises:
+            PrecheckError: If the query fails with a non-retryable error
+            MaxAttemptsError: If the query fails after the maximum number of attempts
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(client.executor, self.execute, client)
+
     def _before_execute(self, client: Client) -> None:
         """
         Performs setup before executing the query.
@@ -11,7 +11,7 @@ This module includes:
 - TokenCreateTransaction: Handles token creation transactions on Hedera.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Optional, Any, List
 
 from hiero_sdk_python.channels import _Channel
@@ -83,6 +83,9 @@ class TokenKeys:
     pause_key: Optional[PrivateKey] = None
     kyc_key: Optional[PrivateKey] = None
 
+_TOKEN_PARAM_FIELDS = frozenset(f.name for f in fields(TokenParams))
+_TOKEN_KEY_FIELDS = frozenset(f.name for f in fields(TokenKeys))
+
 class TokenCreateValidator:
     """Token, key and freeze checks for creating a token as per the proto"""
 
@@ -250,6 +253,77 @@ class TokenCreateTransaction(Transaction):
 
         self._default_transaction_fee = DEFAULT_TRANSACTION_FEE
 
+    @classmethod
+    def for_fungible_finite(
+        cls,
+        token_name: str,
+        token_symbol: str,
+        decimals: int,
+        initial_supply: int,
+        max_supply: int,
+        treasury_account_id: AccountId,
+    ) -> "TokenCreateTransaction":
+        """
+        Creates a transaction for a fungible token with a finite (capped) supply.
+
+        Keys can be added afterwards with the usual `set_*_key` methods.
+        """
+        return cls(TokenParams(
+            token_name=token_name,
+            token_symbol=token_symbol,
+            treasury_account_id=treasury_account_id,
+            decimals=decimals,
+            initial_supply=initial_supply,
+            token_type=TokenType.FUNGIBLE_COMMON,
+            max_supply=max_supply,
+            supply_type=SupplyType.FINITE,
+        ))
+
+    @classmethod
+    def for_fungible_infinite(
+        cls,
+        token_name: str,
+        token_symbol: str,
+        decimals: int,
+        initial_supply: int,
+        treasury_account_id: AccountId,
+    ) -> "TokenCreateTransaction":
+        """
+        Creates a transaction for a fungible token with an infinite supply.
+
+        Keys can be added afterwards with the usual `set_*_key` methods.
+        """
+        return cls(TokenParams(
+            token_name=token_name,
+            token_symbol=token_symbol,
+            treasury_account_id=treasury_account_id,
+            decimals=decimals,
+            initial_supply=initial_supply,
+            token_type=TokenType.FUNGIBLE_COMMON,
+            supply_type=SupplyType.INFINITE,
+        ))
+
+    @classmethod
+    def for_nft_infinite(
+        cls,
+        token_name: str,
+        token_symbol: str,
+        treasury_account_id: AccountId,
+    ) -> "TokenCreateTransaction":
+        """
+        Creates a transaction for a non-fungible (NFT) token with an infinite supply.
+
+        NFTs have no decimals and start with zero supply; serials are minted later.
+        A supply key is required by the network and should be set before freezing.
+        """
+        return cls(TokenParams(
+            token_name=token_name,
+            token_symbol=token_symbol,
+            treasury_account_id=treasury_account_id,
+            token_type=TokenType.NON_FUNGIBLE_UNIQUE,
+            supply_type=SupplyType.INFINITE,
+        ))
+
     def set_token_params(self, token_params: TokenParams) -> "TokenCreateTransaction":
         """
         Replaces the current TokenParams object with the new one.
@@ -268,6 +342,33 @@ class TokenCreateTransaction(Transaction):
         self._keys = keys
         return self
 
+    def configure(self, **kwargs: Any) -> "TokenCreateTransaction":
+        """
+        Sets several token fields and keys in a single call.
+
+        Accepts any TokenParams field (token_name, token_symbol, decimals, ...) or
+        TokenKeys field (admin_key, supply_key, ...) as a keyword argument.
+        Validation is deferred until build time, as with the individual setters.
+
+        Example:
+            TokenCreateTransaction().configure(
+                token_name="MyToken", token_symbol="MTK", initial_supply=10,
+                treasury_account_id=operator_id, admin_key=admin_key,
+            )
+
+        Raises:
+            ValueError: If a keyword is not a token parameter or key.
+        """
+        self._require_not_frozen()
+        unknown = kwargs.keys() - _TOKEN_PARAM_FIELDS - _TOKEN_KEY_FIELDS
+        if unknown:
+            raise ValueError(f"Unknown token field(s): {', '.join(sorted(unknown))}")
+
+        for name, value in kwargs.items():
+            target = self._token_params if name in _TOKEN_PARAM_FIELDS else self._keys
+            setattr(target, name, value)
+        return self
+
     # These allow setting of individual fields
     def set_token_name(self, name: str) -> "TokenCreateTransaction":
         """ Sets the token name for the transaction."""
@@ -0,0 +1,168 @@
+"""
+BatchTransaction class.
+"""
+
+from typing import List, Optional
+
+from hiero_sdk_python.channels import _Channel
+from hiero_sdk_python.executable import _Method
+from hiero_sdk_python.hapi.services.schedulable_transaction_body_pb2 import (
+    SchedulableTransactionBody,
+)
+from hiero_sdk_python.hapi.services.transaction_pb2 import AtomicBatchTransactionBody
+from hiero_sdk_python.transaction.transaction import Transaction
+from hiero_sdk_python.transaction.transaction_id import TransactionId
+
+
+class BatchTransaction(Transaction):
+    """
+    A transaction that executes a list of inner transactions atomically (HIP-551).
+
+    Either every inner transaction succeeds or none of them is applied, and the whole
+    batch reaches consensus in a single round. Each inner transaction must be frozen
+    with a batch key set (see Transaction.batchify()) and the outer batch must be
+    signed by every batch key used by its inner transactions.
+
+    Inner transactions keep their own transaction IDs, so their receipts can be
+    fetched individually with TransactionGetReceiptQuery after the batch executes.
+
+    Inherits from the base Transaction class and implements the required methods
+    to build and execute a batch transaction.
+    """
+
+    def __init__(self, inner_transactions: Optional[List[Transaction]] = None):
+        """
+        Initializes a new BatchTransaction instance.
+
+        Args:
+            inner_transactions (Optional[List[Transaction]]): The inner transactions to batch.
+        """
+        super().__init__()
+        self.inner_transactions: List[Transaction] = []
+        for transaction in inner_transactions or []:
+            self._validate_inner_transaction(transaction)
+            self.inner_transactions.append(transaction)
+
+    def set_inner_transactions(self, inner_transactions: List[Transaction]) -> "BatchTransaction":
+        """
+        Sets the inner transactions of the batch, replacing any previously added.
+
+        Args:
+            inner_transactions (List[Transaction]): The inner transactions to batch.
+
+        Returns:
+            BatchTransaction: This transaction instance.
+
+        Raises:
+            ValueError: If an inner transaction is not frozen or has no batch key.
+        """
+        self._require_not_frozen()
+        for transaction in inner_transactions:
+            self._validate_inner_transaction(transaction)
+        self.inner_transactions = list(inner_transactions)
+        return self
+
+    def add_inner_transaction(self, transaction: Transaction) -> "BatchTransaction":
+        """
+        Adds an inner transaction to the batch.
+
+        Args:
+            transaction (Transaction): A frozen transaction with a batch key set.
+
+        Returns:
+            BatchTransaction: This transaction instance.
+
+        Raises:
+            ValueError: If the transaction is not frozen or has no batch key.
+        """
+        self._require_not_frozen()
+        self._validate_inner_transaction(transaction)
+        self.inner_transactions.append(transaction)
+        return self
+
+    def get_inner_transaction_ids(self) -> List[TransactionId]:
+        """
+        Returns the transaction IDs of the inner transactions, in batch order.
+
+        Returns:
+            List[TransactionId]: The inner transaction IDs.
+        """
+        return [transaction.transaction_id for transaction in self.inner_transactions]
+
+    @staticmethod
+    def _validate_inner_transaction(transaction: Transaction) -> None:
+        """
+        Ensures a transaction can be placed inside a batch.
+
+        Args:
+            transaction (Transaction): The transaction to validate.
+
+        Raises:
+            ValueError: If the transaction is a batch, is not frozen or has no batch key.
+        """
+        if isinstance(transaction, BatchTransaction):
+            raise ValueError("A BatchTransaction cannot be added to another batch.")
+        if transaction.batch_key is None:
+            raise ValueError("Inner transaction must have a batch key set.")
+        if not transaction._transaction_body_bytes:
+            raise ValueError("Inner transaction must be frozen before it is added to a batch.")
+
+    def _build_proto_body(self) -> AtomicBatchTransactionBody:
+        """
+        Builds the protobuf body for the batch transaction.
+
+        Returns:
+            AtomicBatchTransactionBody: The protobuf body for the batch transaction.
+
+        Raises:
+            ValueError: If the batch holds no inner transactions.
+        """
+        if not self.inner_transactions:
+            raise ValueError("Batch transaction must contain at least one inner transaction.")
+
+        return AtomicBatchTransactionBody(
+            transactions=[
+                transaction._to_proto().signedTransactionBytes
+                for transaction in self.inner_transactions
+            ]
+        )
+
+    def build_transaction_body(self):
+        """
+        Builds and returns the protobuf transaction body for batch transaction.
+
+        Returns:
+            TransactionBody: The protobuf transaction body containing the
+                signed inner transactions.
+
+        Raises:
+            ValueError: If the batch holds no inner transactions.
+        """
+        atomic_batch_body = self._build_proto_body()
+        transaction_body = self.build_base_transaction_body()
+        transaction_body.atomic_batch.CopyFrom(atomic_batch_body)
+        return transaction_body
+
+    def build_scheduled_body(self) -> SchedulableTransactionBody:
+        """
+        Batch transactions cannot be scheduled.
+
+        Raises:
+            ValueError: Always, since the network does not support scheduling a batch.
+        """
+        raise ValueError("Cannot schedule a BatchTransaction.")
+
+    def _get_method(self, channel: _Channel) -> _Method:
+        """
+        Returns the appropriate gRPC method for the batch transaction.
+
+        Implements the abstract method from Transaction to provide the specific
+        gRPC method for executing a batch transaction.
+
+        Args:
+            channel (_Channel): The channel containing service stubs
+
+        Returns:
+            _Method: The method wrapper containing the transaction function
+        """
+        return _Method(transaction_func=channel.util.atomicBatch, query_func=None)
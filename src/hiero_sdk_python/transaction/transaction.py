@@ -1,3 +1,4 @@
+import asyncio
 import hashlib
 from typing import Optional
 
@@ -12,8 +13,10 @@ from hiero_sdk_python.hapi.services.transaction_response_pb2 import (Transaction
 from hiero_sdk_python.response_code import ResponseCode
 from hiero_sdk_python.transaction.transaction_id import TransactionId
 from hiero_sdk_python.transaction.transaction_response import TransactionResponse
+from hiero_sdk_python.utils.crypto_utils import keccak256
 
 if TYPE_CHECKING:
+    from hiero_sdk_python.crypto.public_key import PublicKey
     from hiero_sdk_python.schedule.schedule_create_transaction import (
         ScheduleCreateTransaction,
     )
@@ -58,8 +61,18 @@ class Transaction(_Executable):
         # This allows us to maintain the signatures for each unique transaction
         # and ensures that the correct signatures are used when submitting transactions
         self._signature_map: dict[bytes, basic_types_pb2.SignatureMap] = {}
+
+        # Caches the serialized SignedTransaction for each body so retries and batches
+        # do not re-serialize it; entries are dropped whenever a signature is added
+        self._signed_transaction_bytes: dict[bytes, bytes] = {}
+
+        # Caches the Keccak-256 digest of each body signed by ECDSA keys, so a body
+        # signed by several keys (operator, admin, supply...) is hashed only once
+        self._ecdsa_body_digests: dict[bytes, bytes] = {}
         self._default_transaction_fee = 2_000_000
         self.operator_account_id = None  
+        # The key that must sign the outer BatchTransaction when this transaction is batched
+        self.batch_key: Optional["PublicKey"] = None
 
     def _make_request(self):
         """
@@ -131,6 +144,7 @@ class Transaction(_Executable):
             ResponseCode.PLATFORM_TRANSACTION_NOT_CREATED,
             ResponseCode.PLATFORM_NOT_ACTIVE,
             ResponseCode.BUSY,
+            ResponseCode.THROTTLED_AT_CONSENSUS,
         }
 
         if status in retryable_statuses:
@@ -174,22 +188,29 @@ class Transaction(_Executable):
         """
         # We require the transaction to be frozen before signing
         self._require_frozen()
-        
+
+        # The public key is the same for every node body, so derive it only once.
+        public_key_bytes = private_key.public_key().to_bytes_raw()
+        is_ed25519 = private_key.is_ed25519()
+
         # We sign the bodies for each node in case we need to switch nodes during execution.
         for body_bytes in self._transaction_body_bytes.values():
-            signature = private_key.sign(body_bytes)
+            # Skip bodies this key has already signed to avoid duplicate signature pairs
+            if self._has_signature(body_bytes, public_key_bytes):
+                continue
 
-            public_key_bytes = private_key.public_key().to_bytes_raw()
-
-            if private_key.is_ed25519():
+            if is_ed25519:
                 sig_pair = basic_types_pb2.SignaturePair(
                     pubKeyPrefix=public_key_bytes,
-                    ed25519=signature
+                    ed25519=private_key.sign(body_bytes)
                 )
             else:
+                digest = self._ecdsa_body_digests.get(body_bytes)
+                if digest is None:
+                    digest = self._ecdsa_body_digests[body_bytes] = keccak256(body_bytes)
                 sig_pair = basic_types_pb2.SignaturePair(
                     pubKeyPrefix=public_key_bytes,
-                    ECDSA_secp256k1=signature
+                    ECDSA_secp256k1=private_key._sign_ecdsa_digest(digest)
                 )
 
             # We initialize the signature map for this body_bytes if it doesn't exist yet
@@ -197,6 +218,7 @@ class Transaction(_Executable):
 
             # Append the signature pair to the signature map for this transaction body
             self._signature_map[body_bytes].sigPair.append(sig_pair)
+            self._signed_transaction_bytes.pop(body_bytes, None)
         
         return self
 
@@ -217,17 +239,20 @@ class Transaction(_Executable):
         if body_bytes is None:
             raise ValueError(f"No transaction body found for node {self.node_account_id}")
 
-        sig_map = self._signature_map.get(body_bytes)
-        if sig_map is None:
-            raise ValueError("No signature map found for the current transaction body")
+        signed_transaction_bytes = self._signed_transaction_bytes.get(body_bytes)
+        if signed_transaction_bytes is None:
+            sig_map = self._signature_map.get(body_bytes)
+            if sig_map is None:
+                raise ValueError("No signature map found for the current transaction body")
 
-        signed_transaction = transaction_contents_pb2.SignedTransaction(
-            bodyBytes=body_bytes,
-            sigMap=sig_map
-        )
+            signed_transaction_bytes = transaction_contents_pb2.SignedTransaction(
+                bodyBytes=body_bytes,
+                sigMap=sig_map
+            ).SerializeToString()
+            self._signed_transaction_bytes[body_bytes] = signed_transaction_bytes
 
         return transaction_pb2.Transaction(
-            signedTransactionBytes=signed_transaction.SerializeToString()
+            signedTransactionBytes=signed_transaction_bytes
         )
 
     def freeze_with(self, client):
@@ -248,13 +273,25 @@ class Transaction(_Executable):
         
         if self.transaction_id is None:
             self.transaction_id = client.generate_transaction_id()
+
+        # Inner transactions of a batch are never sent to a node directly,
+        # so they are built once with the reserved node account ID 0.0.0
+        if self.batch_key is not None:
+            self.node_account_id = AccountId(0, 0, 0)
+            self._transaction_body_bytes[self.node_account_id] = self.build_transaction_body().SerializeToString()
+            return self
         
-        # We iterate through every node in the client's network
-        # For each node, set the node_account_id and build the transaction body
+        # We serialize one transaction body for every node in the client's network
         # This allows the transaction to be submitted to any node in the network
-        for node in client.network.nodes:
-            self.node_account_id = node._account_id
-            self._transaction_body_bytes[node._account_id] = self.build_transaction_body().SerializeToString()
+        # The bodies only differ by nodeAccountID, so the body is built (and validated) once
+        # and only that field is swapped before serializing it for each node
+        nodes = client.network.nodes
+        if nodes:
+            self.node_account_id = nodes[0]._account_id
+            transaction_body = self.build_transaction_body()
+            for node in nodes:
+                transaction_body.nodeAccountID.CopyFrom(node._account_id._to_proto())
+                self._transaction_body_bytes[node._account_id] = transaction_body.SerializeToString()
         
         # Set the node account id to the current node in the network
         self.node_account_id = client.network.current_node._account_id
@@ -265,7 +302,7 @@ class Transaction(_Executable):
         """
         Executes the transaction on the Hedera network using the provided client.
 
-        This function delegates the core logic to `_execute()` and `get_receipt()`, and may propagate exceptions raised by it.
+        This function delegates the core logic to `submit()` and `get_receipt()`, and may propagate exceptions raised by it.
 
         Args:
             client (Client): The client instance to use for execution.
@@ -278,6 +315,26 @@ class Transaction(_Executable):
             MaxAttemptsError: If the transaction/query fails after the maximum number of attempts
             ReceiptStatusError: If the query fails with a receipt status error
         """
+        return self.submit(client).get_receipt(client)
+
+    def submit(self, client):
+        """
+        Submits the transaction to the Hedera network without waiting for its receipt.
+
+        The call returns as soon as a node has accepted the transaction (precheck),
+        so several transactions can be submitted before any of them reaches consensus.
+        Use `get_receipt()` on the returned response to wait for the outcome.
+
+        Args:
+            client (Client): The client instance to use for submission.
+
+        Returns:
+            TransactionResponse: The response of the node that accepted the transaction.
+
+        Raises:
+            PrecheckError: If the transaction fails with a non-retryable error
+            MaxAttemptsError: If the transaction fails after the maximum number of attempts
+        """
         if not self._transaction_body_bytes:
             self.freeze_with(client)
 
@@ -294,7 +351,30 @@ class Transaction(_Executable):
         response.transaction = self
         response.transaction_id = self.transaction_id
 
-        return response.get_receipt(client)
+        return response
+
+    async def execute_async(self, client):
+        """
+        Executes the transaction without blocking the running event loop.
+
+        The blocking gRPC round-trips of `execute()` run in a worker thread of the client's
+        executor (or the event loop's default one), so independent transactions can be awaited
+        together, e.g. with `asyncio.gather()`, and complete in roughly the time of the slowest
+        one rather than the sum of all of them.
+
+        Args:
+            client (Client): The client instance to use for execution.
+
+        Returns:
+            TransactionReceipt: The receipt of the transaction.
+
+        Raises:
+            PrecheckError: If the transaction/query fails with a non-retryable error
+            MaxAttemptsError: If the transaction/query fails after the maximum number of attempts
+            ReceiptStatusError: If the query fails with a receipt status error
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(client.executor, self.execute, client)
 
     def is_signed_by(self, public_key):
         """
@@ -307,12 +387,27 @@ class Transaction(_Executable):
             bool: True if signed by the given public key, False otherwise.
         """
         public_key_bytes = public_key.to_bytes_raw()
-        
-        sig_map = self._signature_map.get(self._transaction_body_bytes.get(self.node_account_id))
-        
+
+        return self._has_signature(
+            self._transaction_body_bytes.get(self.node_account_id), public_key_bytes
+        )
+
+    def _has_signature(self, body_bytes, public_key_bytes):
+        """
+        Checks if the given transaction body already holds a signature for the public key.
+
+        Args:
+            body_bytes (bytes): The serialized transaction body to look up.
+            public_key_bytes (bytes): The raw public key bytes of the signer.
+
+        Returns:
+            bool: True if a signature pair for the public key exists, False otherwise.
+        """
+        sig_map = self._signature_map.get(body_bytes)
+
         if sig_map is None:
             return False
-        
+
         for sig_pair in sig_map.sigPair:
             if sig_pair.pubKeyPrefix == public_key_bytes:
                 return True
@@ -380,6 +475,9 @@ class Transaction(_Executable):
         custom_fee_limits = [custom_fee._to_proto() for custom_fee in self.custom_fee_limits]
         transaction_body.max_custom_fees.extend(custom_fee_limits)
 
+        if self.batch_key is not None:
+            transaction_body.batch_key.CopyFrom(self.batch_key._to_proto())
+
         return transaction_body
 
     def build_base_scheduled_body(self) -> SchedulableTransactionBody:
@@ -482,3 +580,44 @@ class Transaction(_Executable):
         self._require_not_frozen()
         self.transaction_id = transaction_id
         return self
+
+    def set_batch_key(self, batch_key: "PublicKey"):
+        """
+        Sets the batch key for the transaction.
+
+        The batch key must sign the BatchTransaction that wraps this transaction.
+        Setting it marks the transaction as an inner transaction of an atomic batch.
+
+        Args:
+            batch_key (PublicKey): The public key that must sign the outer batch.
+
+        Returns:
+            Transaction: The current transaction instance for method chaining.
+
+        Raises:
+            Exception: If the transaction has already been frozen.
+        """
+        self._require_not_frozen()
+        self.batch_key = batch_key
+        return self
+
+    def batchify(self, client, batch_key: "PublicKey"):
+        """
+        Prepares the transaction to be added to a BatchTransaction.
+
+        Sets the batch key, freezes the transaction with the client and signs it
+        with the client's operator key.
+
+        Args:
+            client (Client): The client instance to freeze and sign with.
+            batch_key (PublicKey): The public key that must sign the outer batch.
+
+        Returns:
+            Transaction: The current transaction instance for method chaining.
+
+        Raises:
+            Exception: If the transaction has already been frozen.
+        """
+        self.set_batch_key(batch_key)
+        self.freeze_with(client)
+        return self.sign(client.operator_private_key)
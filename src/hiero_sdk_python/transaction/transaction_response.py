@@ -5,6 +5,8 @@ transaction_response.py
 Represents the response from a transaction submitted to the Hedera network.
 Provides methods to retrieve the receipt and access core transaction details.
 """
+from concurrent.futures import ThreadPoolExecutor
+
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.transaction.transaction_id import TransactionId
 # pylint: disable=too-few-public-methods
@@ -23,6 +25,30 @@ class TransactionResponse:
         self.hash: bytes = bytes()
         self.validate_status: bool = False
         self.transaction = None
+        self._receipt_future = None
+
+    def prefetch_receipt(self, client):
+        """
+        Starts retrieving the receipt in the background.
+
+        The receipt query runs on the client's executor (or a dedicated worker thread),
+        so any work done before `get_receipt()` is called overlaps with the wait for consensus.
+
+        Args:
+            client (Client): The client instance to use for receipt retrieval
+
+        Returns:
+            TransactionResponse: This response instance.
+        """
+        if self._receipt_future is None:
+            executor = client.executor
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=1)
+                self._receipt_future = executor.submit(self._query_receipt, client)
+                executor.shutdown(wait=False)
+            else:
+                self._receipt_future = executor.submit(self._query_receipt, client)
+        return self
 
     def get_receipt(self, client):
         """
@@ -35,12 +61,22 @@ class TransactionResponse:
             TransactionReceipt: The receipt from the network, containing the status
                                and any entities created by the transaction
         """
+        if self._receipt_future is not None:
+            return self._receipt_future.result()
+        return self._query_receipt(client)
+
+    def _query_receipt(self, client):
+        """
+        Queries the network for the receipt of this transaction.
+        """
         # TODO: Decide how to avoid circular imports
         from hiero_sdk_python.query.transaction_get_receipt_query import TransactionGetReceiptQuery
-        # TODO: Implement set_node_account_ids() to get failure reason for preHandle failures
+        # The receipt is queried from the node the transaction was submitted to,
+        # which also knows the failure reason of a transaction that failed preHandle
         receipt = (
             TransactionGetReceiptQuery()
             .set_transaction_id(self.transaction_id)
+            .set_node_account_ids([self.node_id])
             .execute(client)
         )
 
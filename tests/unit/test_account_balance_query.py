@@ -1,5 +1,7 @@
 """Tests for the AccountBalanceQuery functionality."""
 
+import asyncio
+
 import pytest
 
 from hiero_sdk_python.account.account_id import AccountId
@@ -49,6 +51,33 @@ def test_execute_account_balance_query():
         except Exception as e:
             pytest.fail(f"Unexpected exception raised: {e}")
 
+def test_execute_async_account_balance_query():
+    """Test awaiting the CryptoGetAccountBalanceQuery with execute_async."""
+    balance_response = response_pb2.Response(
+        cryptogetAccountBalance=CryptoGetAccountBalanceResponse(
+            header=response_header_pb2.ResponseHeader(
+                nodeTransactionPrecheckCode=ResponseCode.OK,
+                responseType=ResponseType.ANSWER_ONLY,
+                cost=0
+            ),
+            accountID=basic_types_pb2.AccountID(
+                shardNum=0,
+                realmNum=0,
+                accountNum=1800
+            ),
+            balance=2000
+        )
+    )
+
+    response_sequences = [[balance_response]]
+
+    with mock_hedera_servers(response_sequences) as client:
+        query = CryptoGetAccountBalanceQuery().set_account_id(AccountId(0, 0, 1800))
+
+        balance = asyncio.run(query.execute_async(client))
+
+        assert balance.hbars.to_tinybars() == 2000
+
 def test_account_balance_query_does_not_require_payment():
     """Test that the account balance query does not require payment."""
     query = CryptoGetAccountBalanceQuery()
@@ -14,6 +14,7 @@ from hiero_sdk_python.hapi.services import transaction_get_receipt_pb2, response
 from hiero_sdk_python.hapi.services.schedulable_transaction_body_pb2 import (
     SchedulableTransactionBody,
 )
+from hiero_sdk_python.utils.crypto_utils import keccak256
 from tests.unit.mock_server import mock_hedera_servers
 
 pytestmark = pytest.mark.unit
@@ -126,6 +127,32 @@ def test_account_create_transaction_sign(mock_account_ids, mock_client):
     assert len(account_tx._signature_map[body_bytes].sigPair) == 2, \
         "Transaction should have exactly two signatures"
 
+def test_account_create_transaction_ecdsa_body_hashed_once(mock_account_ids, mock_client):
+    """Test that a body signed by several ECDSA keys is hashed once and every signature verifies."""
+    operator_id, node_account_id = mock_account_ids
+    private_keys = [PrivateKey.generate("ecdsa"), PrivateKey.generate("ecdsa")]
+
+    account_tx = (
+        AccountCreateTransaction()
+        .set_key(private_keys[0].public_key())
+        .set_initial_balance(100000000)
+    )
+    account_tx.transaction_id = generate_transaction_id(operator_id)
+    account_tx.freeze_with(mock_client)
+
+    with patch(
+        "hiero_sdk_python.transaction.transaction.keccak256", wraps=keccak256
+    ) as mock_keccak256:
+        for private_key in private_keys:
+            account_tx.sign(private_key)
+
+    assert mock_keccak256.call_count == len(account_tx._transaction_body_bytes)
+
+    body_bytes = account_tx._transaction_body_bytes[node_account_id]
+    sig_pairs = account_tx._signature_map[body_bytes].sigPair
+    for private_key, sig_pair in zip(private_keys, sig_pairs):
+        private_key.public_key().verify(sig_pair.ECDSA_secp256k1, body_bytes)
+
 def test_account_create_transaction():
     """Integration test for AccountCreateTransaction with retry and response handling."""
     # Create test transaction responses
@@ -447,3 +447,12 @@ def test_alias_key_affects_string_representation(alias_key, alias_key2, account_
 
     # Account without alias should use num
     assert str3 == "0.0.100"
+
+
+def test_account_id_has_no_instance_dict():
+    """Test that AccountId instances only carry their declared fields."""
+    account_id = AccountId(shard=0, realm=0, num=100)
+
+    assert not hasattr(account_id, "__dict__")
+    with pytest.raises(AttributeError):
+        account_id.unknown_field = 1
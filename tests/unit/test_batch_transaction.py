@@ -0,0 +1,179 @@
+"""
+Test cases for the BatchTransaction class.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.hapi.services import (
+    response_header_pb2,
+    response_pb2,
+    transaction_contents_pb2,
+    transaction_get_receipt_pb2,
+    transaction_pb2,
+    transaction_receipt_pb2,
+    transaction_response_pb2,
+)
+from hiero_sdk_python.prng_transaction import PrngTransaction
+from hiero_sdk_python.response_code import ResponseCode
+from hiero_sdk_python.transaction.batch_transaction import BatchTransaction
+from tests.unit.mock_server import mock_hedera_servers
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def inner_transaction(mock_client):
+    """Fixture for a frozen and signed inner transaction with a batch key."""
+    batch_key = mock_client.operator_private_key.public_key()
+    return PrngTransaction(range=10).batchify(mock_client, batch_key)
+
+
+def test_batchify_sets_batch_key_and_freezes_for_node_zero(mock_client, inner_transaction):
+    """Test batchify freezes a single body for node 0.0.0 carrying the batch key."""
+    batch_key = mock_client.operator_private_key.public_key()
+
+    assert inner_transaction.batch_key.to_bytes_raw() == batch_key.to_bytes_raw()
+    assert list(inner_transaction._transaction_body_bytes) == [AccountId(0, 0, 0)]
+    assert inner_transaction.is_signed_by(batch_key)
+
+    body = transaction_pb2.TransactionBody()
+    body.ParseFromString(inner_transaction._transaction_body_bytes[AccountId(0, 0, 0)])
+    assert body.batch_key == batch_key._to_proto()
+    assert body.nodeAccountID == AccountId(0, 0, 0)._to_proto()
+
+
+def test_constructor_with_inner_transactions(inner_transaction):
+    """Test creating a batch transaction with constructor parameters."""
+    batch_tx = BatchTransaction(inner_transactions=[inner_transaction])
+
+    assert batch_tx.inner_transactions == [inner_transaction]
+
+
+def test_add_inner_transaction(inner_transaction):
+    """Test adding an inner transaction using the method chaining."""
+    batch_tx = BatchTransaction()
+
+    result = batch_tx.add_inner_transaction(inner_transaction)
+
+    assert result is batch_tx
+    assert batch_tx.get_inner_transaction_ids() == [inner_transaction.transaction_id]
+
+
+def test_set_inner_transactions_replaces_existing(mock_client, inner_transaction):
+    """Test set_inner_transactions replaces any previously added transactions."""
+    batch_key = mock_client.operator_private_key.public_key()
+    other = PrngTransaction().batchify(mock_client, batch_key)
+
+    batch_tx = BatchTransaction().add_inner_transaction(inner_transaction)
+    batch_tx.set_inner_transactions([other])
+
+    assert batch_tx.inner_transactions == [other]
+
+
+def test_add_inner_transaction_without_batch_key_raises(mock_client):
+    """Test adding a transaction with no batch key raises an error."""
+    transaction = PrngTransaction().freeze_with(mock_client)
+
+    with pytest.raises(ValueError, match="must have a batch key set"):
+        BatchTransaction().add_inner_transaction(transaction)
+
+
+def test_add_unfrozen_inner_transaction_raises(mock_client):
+    """Test adding a transaction that is not frozen raises an error."""
+    transaction = PrngTransaction().set_batch_key(mock_client.operator_private_key.public_key())
+
+    with pytest.raises(ValueError, match="must be frozen"):
+        BatchTransaction().add_inner_transaction(transaction)
+
+
+def test_add_batch_as_inner_transaction_raises():
+    """Test nesting a batch inside another batch raises an error."""
+    with pytest.raises(ValueError, match="cannot be added to another batch"):
+        BatchTransaction().add_inner_transaction(BatchTransaction())
+
+
+def test_build_transaction_body(mock_account_ids, inner_transaction):
+    """Test the batch body holds the signed bytes of each inner transaction."""
+    operator_id, _, node_account_id, _, _ = mock_account_ids
+
+    batch_tx = BatchTransaction().add_inner_transaction(inner_transaction)
+    batch_tx.operator_account_id = operator_id
+    batch_tx.node_account_id = node_account_id
+
+    transaction_body = batch_tx.build_transaction_body()
+
+    assert transaction_body.HasField("atomic_batch")
+    assert len(transaction_body.atomic_batch.transactions) == 1
+
+    signed = transaction_contents_pb2.SignedTransaction()
+    signed.ParseFromString(transaction_body.atomic_batch.transactions[0])
+    assert signed.bodyBytes == inner_transaction._transaction_body_bytes[AccountId(0, 0, 0)]
+    assert len(signed.sigMap.sigPair) == 1
+
+
+def test_build_transaction_body_without_inner_transactions_raises(mock_account_ids):
+    """Test building an empty batch raises an error."""
+    operator_id, _, node_account_id, _, _ = mock_account_ids
+
+    batch_tx = BatchTransaction()
+    batch_tx.operator_account_id = operator_id
+    batch_tx.node_account_id = node_account_id
+
+    with pytest.raises(ValueError, match="at least one inner transaction"):
+        batch_tx.build_transaction_body()
+
+
+def test_build_scheduled_body_raises(inner_transaction):
+    """Test that a batch transaction cannot be scheduled."""
+    with pytest.raises(ValueError, match="Cannot schedule a BatchTransaction"):
+        BatchTransaction().add_inner_transaction(inner_transaction).build_scheduled_body()
+
+
+def test_get_method():
+    """Test retrieving the gRPC method for the transaction."""
+    batch_tx = BatchTransaction()
+
+    mock_channel = MagicMock()
+    mock_util_stub = MagicMock()
+    mock_channel.util = mock_util_stub
+
+    method = batch_tx._get_method(mock_channel)
+
+    assert method.query is None
+    assert method.transaction == mock_util_stub.atomicBatch
+
+
+def test_batch_transaction_can_execute():
+    """Test that a batch transaction can be executed successfully."""
+    ok_response = transaction_response_pb2.TransactionResponse()
+    ok_response.nodeTransactionPrecheckCode = ResponseCode.OK
+
+    mock_receipt_proto = transaction_receipt_pb2.TransactionReceipt(
+        status=ResponseCode.SUCCESS
+    )
+
+    receipt_query_response = response_pb2.Response(
+        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
+            header=response_header_pb2.ResponseHeader(
+                nodeTransactionPrecheckCode=ResponseCode.OK
+            ),
+            receipt=mock_receipt_proto,
+        )
+    )
+
+    response_sequences = [
+        [ok_response, receipt_query_response],
+    ]
+
+    with mock_hedera_servers(response_sequences) as client:
+        batch_key = client.operator_private_key.public_key()
+        transaction = BatchTransaction().add_inner_transaction(
+            PrngTransaction(range=10).batchify(client, batch_key)
+        )
+
+        receipt = transaction.execute(client)
+
+        assert receipt.status == ResponseCode.SUCCESS, "Transaction should have succeeded"
@@ -127,6 +127,137 @@ def test_node_switching_after_single_grpc_error():
         assert client.network.current_node._account_id == AccountId(0, 0, 4), "Client should have switched to the second node"
 
 
+def test_unavailable_error_recycles_node_channel():
+    """Test that a node's channel is dropped after an UNAVAILABLE error so it is reopened on next use."""
+    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
+    error = RealRpcError(grpc.StatusCode.UNAVAILABLE, "Test error")
+
+    response_sequences = [
+        [error],
+        [ok_response],
+    ]
+
+    with mock_hedera_servers(response_sequences) as client, patch('time.sleep'):
+        failed_node = client.network.nodes[0]
+        client.network._node_index = 0
+        client.network.current_node = failed_node
+
+        transaction = (
+            AccountCreateTransaction()
+            .set_key(PrivateKey.generate().public_key())
+            .set_initial_balance(100_000_000)
+        )
+        response = transaction.submit(client)
+
+        assert failed_node._channel is None, "The failed node's channel should have been dropped"
+        assert response.node_id == client.network.nodes[1]._account_id
+
+
+def test_recycled_channel_is_not_closed_under_other_calls():
+    """Test that a call already holding a recycled channel can still complete on it."""
+    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
+    error = RealRpcError(grpc.StatusCode.UNAVAILABLE, "Test error")
+
+    response_sequences = [
+        [error, ok_response],
+        [ok_response],
+    ]
+
+    with mock_hedera_servers(response_sequences) as client, patch('time.sleep'):
+        failed_node = client.network.nodes[0]
+        client.network._node_index = 0
+        client.network.current_node = failed_node
+        # Channel of another thread's call that is in flight while the error is handled
+        in_flight_channel = failed_node._get_channel()
+
+        transaction = (
+            AccountCreateTransaction()
+            .set_key(PrivateKey.generate().public_key())
+            .set_initial_balance(100_000_000)
+        )
+        transaction.submit(client)
+
+        assert failed_node._get_channel() is not in_flight_channel
+        transaction.node_account_id = failed_node._account_id
+        response = transaction._get_method(in_flight_channel).transaction(transaction._to_proto())
+        assert response.nodeTransactionPrecheckCode == ResponseCode.OK
+
+
+def test_consecutive_executions_are_spread_across_nodes():
+    """Test that each execution starts on the next node instead of reusing the same one."""
+    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
+
+    response_sequences = [
+        [ok_response],
+        [ok_response],
+    ]
+
+    with mock_hedera_servers(response_sequences) as client:
+        responses = [
+            AccountCreateTransaction()
+            .set_key(PrivateKey.generate().public_key())
+            .set_initial_balance(100_000_000)
+            .submit(client)
+            for _ in range(2)
+        ]
+
+        assert {response.node_id for response in responses} == {
+            node._account_id for node in client.network.nodes
+        }
+
+
+def test_receipt_query_is_sent_to_submitting_node():
+    """Test that a receipt is queried from the node the transaction was submitted to."""
+    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
+
+    receipt_response = response_pb2.Response(
+        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
+            header=response_header_pb2.ResponseHeader(
+                nodeTransactionPrecheckCode=ResponseCode.OK
+            ),
+            receipt=transaction_receipt_pb2.TransactionReceipt(
+                status=ResponseCode.SUCCESS
+            )
+        )
+    )
+
+    other_receipt_response = response_pb2.Response(
+        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
+            header=response_header_pb2.ResponseHeader(
+                nodeTransactionPrecheckCode=ResponseCode.OK
+            ),
+            receipt=transaction_receipt_pb2.TransactionReceipt(
+                status=ResponseCode.INVALID_SIGNATURE
+            )
+        )
+    )
+
+    # The next node in round-robin order would answer with a different receipt
+    response_sequences = [
+        [ok_response, receipt_response],
+        [ok_response],
+        [other_receipt_response],
+    ]
+
+    with mock_hedera_servers(response_sequences) as client:
+        client.network._node_index = 0
+        client.network.current_node = client.network.nodes[0]
+
+        responses = [
+            AccountCreateTransaction()
+            .set_key(PrivateKey.generate().public_key())
+            .set_initial_balance(100_000_000)
+            .submit(client)
+            for _ in range(2)
+        ]
+        assert responses[0].node_id == client.network.nodes[0]._account_id
+        assert responses[1].node_id == client.network.nodes[1]._account_id
+
+        receipt = responses[0].get_receipt(client)
+
+        assert receipt.status == ResponseCode.SUCCESS
+
+
 def test_node_switching_after_multiple_grpc_errors():
     """Test that execution switches nodes after receiving multiple non-retriable errors."""
     ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
@@ -272,6 +403,36 @@ def test_exponential_backoff_retry():
         for i in range(1, len(sleep_args)):
             assert abs(sleep_args[i] - sleep_args[i-1] * 2) < 0.1, f"Expected doubling delays, but got {sleep_args}"
 
+def test_transaction_retries_when_throttled_at_consensus():
+    """Test that a THROTTLED_AT_CONSENSUS precheck is retried with backoff like BUSY."""
+    throttled_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.THROTTLED_AT_CONSENSUS)
+    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
+
+    receipt_response = response_pb2.Response(
+        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
+            header=response_header_pb2.ResponseHeader(
+                nodeTransactionPrecheckCode=ResponseCode.OK
+            ),
+            receipt=transaction_receipt_pb2.TransactionReceipt(
+                status=ResponseCode.SUCCESS
+            )
+        )
+    )
+
+    response_sequences = [[throttled_response, ok_response, receipt_response]]
+
+    with mock_hedera_servers(response_sequences) as client, patch('time.sleep') as mock_sleep:
+        transaction = (
+            AccountCreateTransaction()
+            .set_key(PrivateKey.generate().public_key())
+            .set_initial_balance(100_000_000)
+        )
+
+        receipt = transaction.execute(client)
+
+        assert receipt.status == ResponseCode.SUCCESS
+        assert mock_sleep.call_count == 1, "Should have retried once"
+
 def test_retriable_error_does_not_switch_node():
     """Test that a retriable error does not switch nodes."""
     busy_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.BUSY)
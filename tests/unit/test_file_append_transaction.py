@@ -3,6 +3,13 @@ import pytest
 
 from hiero_sdk_python.file.file_append_transaction import FileAppendTransaction
 from hiero_sdk_python.file.file_id import FileId
+from hiero_sdk_python.hapi.services import (
+    response_header_pb2,
+    response_pb2,
+    transaction_get_receipt_pb2,
+    transaction_receipt_pb2,
+    transaction_response_pb2,
+)
 from hiero_sdk_python.hapi.services.schedulable_transaction_body_pb2 import (
     SchedulableTransactionBody,
 )
@@ -11,6 +18,7 @@ from hiero_sdk_python.response_code import ResponseCode
 from hiero_sdk_python.timestamp import Timestamp
 from hiero_sdk_python.transaction.transaction import Transaction
 from hiero_sdk_python.transaction.transaction_id import TransactionId
+from tests.unit.mock_server import mock_hedera_servers
 
 
 
@@ -129,16 +137,29 @@ def test_multi_chunk_execution():
     mock_client = MagicMock()
     mock_receipt = MagicMock()
     mock_receipt.status = ResponseCode.SUCCESS
+    mock_response = MagicMock()
+    mock_response.get_receipt.return_value = mock_receipt
     
-    # Mock the execute method to return our mock receipt
-    with patch.object(Transaction, 'execute', return_value=mock_receipt):
+    # Mock the submit method to return a response with our mock receipt
+    with patch.object(Transaction, 'submit', return_value=mock_response):
         receipt = file_tx.execute(mock_client)
         
         # Should return the first receipt
         assert receipt == mock_receipt
         
-        # Should have called execute 3 times (once per chunk)
-        assert Transaction.execute.call_count == 1
+        # Should have called submit 3 times (once per chunk)
+        assert Transaction.submit.call_count == 3
+
+def test_submit_multi_chunk_raises():
+    """Test that a multi-chunk transaction cannot be submitted without waiting for receipts."""
+    file_tx = FileAppendTransaction(
+        file_id=FileId(0, 0, 12345),
+        contents=b"Chunk1Chunk2Chunk3",
+        chunk_size=6
+    )
+
+    with pytest.raises(ValueError, match="must be sent with execute"):
+        file_tx.submit(MagicMock())
 
 def test_build_transaction_body_missing_file_id():
     """Test build_transaction_body raises error when file ID is missing."""
@@ -170,3 +191,44 @@ def test_build_scheduled_body():
     # Verify fields in the schedulable body
     assert schedulable_body.fileAppend.fileID == file_id._to_proto()
     assert schedulable_body.fileAppend.contents == contents[:100]  # First chunk
+
+def test_multi_chunk_execution_sends_every_chunk():
+    """Test that a multi-chunk append submits each chunk and waits for its receipt."""
+    ok_response = transaction_response_pb2.TransactionResponse()
+    ok_response.nodeTransactionPrecheckCode = ResponseCode.OK
+
+    receipt_query_response = response_pb2.Response(
+        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
+            header=response_header_pb2.ResponseHeader(
+                nodeTransactionPrecheckCode=ResponseCode.OK
+            ),
+            receipt=transaction_receipt_pb2.TransactionReceipt(
+                status=ResponseCode.SUCCESS
+            ),
+        )
+    )
+
+    # One submission and one receipt query per chunk
+    response_sequences = [
+        [ok_response, receipt_query_response] * 3,
+    ]
+
+    with mock_hedera_servers(response_sequences) as client:
+        file_tx = FileAppendTransaction(
+            file_id=FileId(0, 0, 12345),
+            contents=b"Chunk1Chunk2Chunk3",
+            chunk_size=6
+        )
+
+        submitted_chunks = []
+        original_execute = Transaction._execute
+
+        def record_chunk(tx, exec_client):
+            submitted_chunks.append(tx._build_proto_body().contents)
+            return original_execute(tx, exec_client)
+
+        with patch.object(Transaction, "_execute", autospec=True, side_effect=record_chunk):
+            receipt = file_tx.execute(client)
+
+        assert receipt.status == ResponseCode.SUCCESS
+        assert submitted_chunks == [b"Chunk1", b"Chunk2", b"Chunk3"]
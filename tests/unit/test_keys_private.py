@@ -171,6 +171,19 @@ def test_from_string_der_ecdsa_round_trip():
     assert loaded.to_bytes_ecdsa_raw() == scalar_one
 
 
+def test_from_string_der_legacy_ecdsa():
+    """
+    Load a legacy ECDSA DER key (fixed prefix + 32-byte scalar) via from_string_der()
+    and the catch-all from_string(), confirming both yield the same secp256k1 scalar.
+    """
+    scalar_one = (1).to_bytes(32, "big")
+    legacy_hex = "3030020100300706052b8104000a04220420" + scalar_one.hex()
+
+    for loaded in (PrivateKey.from_string_der(legacy_hex), PrivateKey.from_string(legacy_hex)):
+        assert loaded.is_ecdsa()
+        assert loaded.to_bytes_ecdsa_raw() == scalar_one
+
+
 def test_from_string_der_invalid_hex():
     """
     Attempt to load DER from a string that is not valid hex,
@@ -411,6 +424,17 @@ def test_public_key_roundtrip_der_and_raw():
     assert pub2.to_string_ecdsa() == pub.to_string_ecdsa()
 
 
+@pytest.mark.parametrize("key_type", ["ed25519", "ecdsa"])
+def test_public_key_is_derived_once(key_type):
+    """
+    Test that the derived public key is cached and returned on later calls.
+    """
+    priv = PrivateKey.generate(key_type)
+    pub = priv.public_key()
+    assert priv.public_key() is pub
+    assert pub.to_bytes_raw() == PublicKey(priv._private_key.public_key()).to_bytes_raw()
+
+
 @pytest.mark.parametrize("key_type", ["ed25519", "ecdsa"])
 def test_repr_contains_full_hex(key_type):
     """
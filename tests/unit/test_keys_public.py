@@ -491,6 +491,20 @@ def test_to_proto_ecdsa(ecdsa_keypair):
     # The bytes in the proto should exactly match the compressed secp256k1 bytes
     assert proto.ECDSA_secp256k1 == pubk.to_bytes_ecdsa()
 
+
+def test_to_bytes_raw_is_encoded_once(ed25519_keypair, ecdsa_keypair):
+    ed_pub = PublicKey(ed25519_keypair[1])
+    ec_pub = PublicKey(ecdsa_keypair[1])
+
+    ed_raw = ed_pub.to_bytes_raw()
+    ec_raw = ec_pub.to_bytes_raw()
+
+    # Later calls reuse the bytes encoded by the first one
+    assert ed_pub.to_bytes_raw() is ed_raw
+    assert ec_pub.to_bytes_raw() is ec_raw
+    assert ed_raw == ed_pub.to_bytes_ed25519()
+    assert ec_raw == ec_pub.to_bytes_ecdsa()
+
 # ------------------------------------------------------------------------------
 # Test: verify signatures
 # ------------------------------------------------------------------------------
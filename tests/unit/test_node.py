@@ -0,0 +1,43 @@
+"""
+Test cases for the _Node class.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.node import _GRPC_CHANNEL_OPTIONS, _Node
+
+pytestmark = pytest.mark.unit
+
+
+def test_get_channel_uses_keepalive_options():
+    """Test the node channel is created with the keepalive channel options."""
+    node = _Node(AccountId(0, 0, 3), "127.0.0.1:50211", None)
+
+    with patch("hiero_sdk_python.node.grpc.insecure_channel") as mock_insecure_channel:
+        node._get_channel()
+
+    mock_insecure_channel.assert_called_once_with("127.0.0.1:50211", options=_GRPC_CHANNEL_OPTIONS)
+
+
+def test_keepalive_options_respect_server_ping_policy():
+    """Test keepalive pings are not sent more often than gRPC servers allow by default."""
+    options = dict(_GRPC_CHANNEL_OPTIONS)
+
+    assert options["grpc.keepalive_time_ms"] >= 300_000
+    assert not options.get("grpc.keepalive_permit_without_calls")
+    assert "grpc.http2.max_pings_without_data" not in options
+
+
+def test_get_channel_is_reused():
+    """Test repeated calls return the same cached channel."""
+    node = _Node(AccountId(0, 0, 3), "127.0.0.1:50211", None)
+
+    with patch("hiero_sdk_python.node.grpc.insecure_channel") as mock_insecure_channel:
+        first = node._get_channel()
+        second = node._get_channel()
+
+    assert first is second
+    mock_insecure_channel.assert_called_once()
@@ -38,6 +38,15 @@ def test_set_query_payment(query):
     assert result == query
     assert query.payment_amount == payment
     
+def test_set_node_account_ids(query, mock_client):
+    """Test that nodes set on the query are kept by _before_execute"""
+    node_account_ids = [mock_client.network.nodes[0]._account_id]
+    result = query.set_node_account_ids(node_account_ids)
+    query._before_execute(mock_client)
+
+    assert result == query
+    assert query.node_account_ids == node_account_ids
+
 def test_before_execute_payment_not_required(query, mock_client):
     """Test _before_execute method setup for query that doesn't require payment"""
     # payment_amount is None, should not set payment_amount
@@ -215,6 +215,29 @@ def test_sign_transaction(mock_account_ids, mock_client):
     assert sig_pair.pubKeyPrefix == b'public_key'  
     assert sig_pair.ed25519 == b'signature'
 
+def test_sign_transaction_twice_with_same_key(mock_account_ids, mock_client):
+    """Test signing twice with the same key does not add a duplicate signature."""
+    sender, receiver, _, token_id, _ = mock_account_ids
+    pending_airdrop = PendingAirdropId(sender_id=sender, receiver_id=receiver, token_id=token_id)
+
+    cancel_airdrop_tx = TokenCancelAirdropTransaction()
+    cancel_airdrop_tx.add_pending_airdrop(pending_airdrop)
+    cancel_airdrop_tx.transaction_id = generate_transaction_id(sender)
+
+    private_key = MagicMock()
+    private_key.sign.return_value = b'signature'
+    private_key.public_key().to_bytes_raw.return_value = b'public_key'
+
+    cancel_airdrop_tx.freeze_with(mock_client)
+    cancel_airdrop_tx.sign(private_key)
+    cancel_airdrop_tx.sign(private_key)
+
+    node_id = mock_client.network.current_node._account_id
+    body_bytes = cancel_airdrop_tx._transaction_body_bytes[node_id]
+
+    assert len(cancel_airdrop_tx._signature_map[body_bytes].sigPair) == 1
+    assert private_key.sign.call_count == len(cancel_airdrop_tx._transaction_body_bytes)
+
 def test_to_proto(mock_account_ids, mock_client):
     """Test converting the token cancel airdrop transaction to protobuf format after signing."""
     sender, receiver, _, token_id, _ = mock_account_ids
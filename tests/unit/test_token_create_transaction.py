@@ -619,6 +619,94 @@ def test_transaction_freeze_prevents_modification(mock_account_ids, mock_client)
     assert transaction._token_params.treasury_account_id == treasury_account
     assert transaction._token_params.token_type == TokenType.FUNGIBLE_COMMON
 
+def test_configure_sets_params_and_keys(mock_account_ids, private_key):
+    """Test configure() assigns token params and keys in a single call."""
+    treasury_account, _, _, _, _ = mock_account_ids
+
+    transaction = TokenCreateTransaction()
+    result = transaction.configure(
+        token_name="TestName",
+        token_symbol="TEST",
+        decimals=2,
+        initial_supply=10,
+        treasury_account_id=treasury_account,
+        supply_type=SupplyType.FINITE,
+        max_supply=100,
+        admin_key=private_key,
+    )
+
+    assert result is transaction
+    assert transaction._token_params.token_name == "TestName"
+    assert transaction._token_params.token_symbol == "TEST"
+    assert transaction._token_params.decimals == 2
+    assert transaction._token_params.initial_supply == 10
+    assert transaction._token_params.treasury_account_id == treasury_account
+    assert transaction._token_params.supply_type == SupplyType.FINITE
+    assert transaction._token_params.max_supply == 100
+    assert transaction._keys.admin_key == private_key
+
+def test_configure_rejects_unknown_fields():
+    """Test configure() raises for keywords that are not token params or keys."""
+    transaction = TokenCreateTransaction()
+
+    with pytest.raises(ValueError, match="Unknown token field\\(s\\): bogus"):
+        transaction.configure(token_name="TestName", bogus=1)
+
+    # Nothing is applied when a keyword is rejected
+    assert transaction._token_params.token_name == ""
+
+def test_configure_after_freeze_raises(mock_account_ids, mock_client):
+    """Test configure() cannot modify a frozen transaction."""
+    treasury_account, _, _, _, _ = mock_account_ids
+
+    transaction = TokenCreateTransaction().configure(
+        token_name="TestName", token_symbol="TEST", initial_supply=1, treasury_account_id=treasury_account
+    )
+    transaction.freeze_with(mock_client)
+
+    with pytest.raises(Exception, match="Transaction is immutable; it has been frozen."):
+        transaction.configure(token_name="NewName")
+
+def test_for_fungible_finite(mock_account_ids):
+    """Test the finite fungible factory pre-fills the token params."""
+    treasury_account, _, _, _, _ = mock_account_ids
+
+    transaction = TokenCreateTransaction.for_fungible_finite("TestName", "TEST", 2, 10, 100, treasury_account)
+
+    params = transaction._token_params
+    assert (params.token_name, params.token_symbol) == ("TestName", "TEST")
+    assert (params.decimals, params.initial_supply, params.max_supply) == (2, 10, 100)
+    assert params.treasury_account_id == treasury_account
+    assert params.token_type == TokenType.FUNGIBLE_COMMON
+    assert params.supply_type == SupplyType.FINITE
+
+def test_for_fungible_infinite(mock_account_ids, private_key):
+    """Test the infinite fungible factory pre-fills the token params and keeps chaining."""
+    treasury_account, _, _, _, _ = mock_account_ids
+
+    transaction = (
+        TokenCreateTransaction.for_fungible_infinite("TestName", "TEST", 2, 1000, treasury_account)
+        .set_admin_key(private_key)
+    )
+
+    params = transaction._token_params
+    assert (params.decimals, params.initial_supply, params.max_supply) == (2, 1000, 0)
+    assert params.token_type == TokenType.FUNGIBLE_COMMON
+    assert params.supply_type == SupplyType.INFINITE
+    assert transaction._keys.admin_key == private_key
+
+def test_for_nft_infinite(mock_account_ids):
+    """Test the infinite NFT factory pre-fills the token params."""
+    treasury_account, _, _, _, _ = mock_account_ids
+
+    transaction = TokenCreateTransaction.for_nft_infinite("MyNFT", "NFT", treasury_account)
+
+    params = transaction._token_params
+    assert (params.decimals, params.initial_supply, params.max_supply) == (0, 0, 0)
+    assert params.treasury_account_id == treasury_account
+    assert params.token_type == TokenType.NON_FUNGIBLE_UNIQUE
+    assert params.supply_type == SupplyType.INFINITE
+
 # This test uses fixture mock_account_ids as parameter
 def test_build_transaction_body_non_fungible(mock_account_ids):
     """
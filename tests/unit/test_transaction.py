@@ -0,0 +1,164 @@
+"""
+Test cases for the behaviour shared by all transactions in the Transaction base class
+and TransactionResponse. PrngTransaction is used as the concrete transaction.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.client.client import Client
+from hiero_sdk_python.client.network import Network
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.hapi.services import (
+    response_header_pb2,
+    response_pb2,
+    transaction_contents_pb2,
+    transaction_get_receipt_pb2,
+    transaction_pb2,
+    transaction_receipt_pb2,
+    transaction_response_pb2,
+)
+from hiero_sdk_python.logger.log_level import LogLevel
+from hiero_sdk_python.node import _Node
+from hiero_sdk_python.prng_transaction import PrngTransaction
+from hiero_sdk_python.response_code import ResponseCode
+from tests.unit.mock_server import mock_hedera_servers
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def ok_response():
+    """Fixture for a transaction response that passed precheck."""
+    return transaction_response_pb2.TransactionResponse(
+        nodeTransactionPrecheckCode=ResponseCode.OK
+    )
+
+
+@pytest.fixture
+def receipt_query_response():
+    """Fixture for a receipt query response with a SUCCESS receipt."""
+    return response_pb2.Response(
+        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
+            header=response_header_pb2.ResponseHeader(
+                nodeTransactionPrecheckCode=ResponseCode.OK
+            ),
+            receipt=transaction_receipt_pb2.TransactionReceipt(
+                status=ResponseCode.SUCCESS
+            ),
+        )
+    )
+
+
+def test_freeze_with_builds_body_once_for_all_nodes():
+    """Test freezing builds the body once and serializes it per node with its node account ID."""
+    node_ids = [AccountId(0, 0, 3), AccountId(0, 0, 4), AccountId(0, 0, 5)]
+    network = Network(nodes=[_Node(node_id, f"node{node_id.num}.example.com:50211", None) for node_id in node_ids])
+    client = Client(network)
+    client.logger.set_level(LogLevel.DISABLED)
+    client.set_operator(AccountId(0, 0, 1984), PrivateKey.generate())
+
+    transaction = PrngTransaction(range=1000)
+
+    with patch.object(
+        PrngTransaction, "build_transaction_body", autospec=True,
+        side_effect=PrngTransaction.build_transaction_body,
+    ) as mock_build:
+        transaction.freeze_with(client)
+
+    assert mock_build.call_count == 1
+    assert list(transaction._transaction_body_bytes) == node_ids
+
+    for node_id, body_bytes in transaction._transaction_body_bytes.items():
+        body = transaction_pb2.TransactionBody()
+        body.ParseFromString(body_bytes)
+        assert body.nodeAccountID == node_id._to_proto()
+        assert body.util_prng.range == 1000
+        assert body.transactionID == transaction.transaction_id._to_proto()
+
+
+def test_to_proto_reuses_signed_bytes_until_signed_again(mock_client):
+    """Test the signed transaction bytes are cached and refreshed when a new signature is added."""
+    transaction = PrngTransaction(range=1000).freeze_with(mock_client)
+    transaction.sign(mock_client.operator_private_key)
+
+    first = transaction._to_proto().signedTransactionBytes
+    body_bytes = transaction._transaction_body_bytes[transaction.node_account_id]
+    assert transaction._signed_transaction_bytes[body_bytes] == first
+    assert transaction._to_proto().signedTransactionBytes == first
+
+    transaction.sign(PrivateKey.generate())
+
+    signed = transaction_contents_pb2.SignedTransaction()
+    signed.ParseFromString(transaction._to_proto().signedTransactionBytes)
+    assert len(signed.sigMap.sigPair) == 2
+
+
+def test_execute_async(ok_response, receipt_query_response):
+    """Test that a transaction can be awaited with execute_async."""
+    response_sequences = [
+        [ok_response, receipt_query_response],
+    ]
+
+    with mock_hedera_servers(response_sequences) as client:
+        transaction = PrngTransaction().set_range(1000)
+
+        receipt = asyncio.run(transaction.execute_async(client))
+
+        assert receipt.status == ResponseCode.SUCCESS, "Transaction should have succeeded"
+
+
+def test_execute_async_uses_client_executor(ok_response, receipt_query_response):
+    """Test that execute_async runs on the executor configured on the client."""
+    response_sequences = [
+        [ok_response, receipt_query_response],
+    ]
+
+    with mock_hedera_servers(response_sequences) as client, ThreadPoolExecutor(max_workers=1) as executor:
+        client.executor = executor
+        transaction = PrngTransaction().set_range(1000)
+
+        with patch.object(executor, "submit", wraps=executor.submit) as mock_submit:
+            receipt = asyncio.run(transaction.execute_async(client))
+
+        assert receipt.status == ResponseCode.SUCCESS, "Transaction should have succeeded"
+        mock_submit.assert_called_once()
+
+
+def test_submit_returns_without_receipt(ok_response):
+    """Test that submit returns the transaction response without querying the receipt."""
+    # Only the submission is answered; a receipt query would find no response
+    response_sequences = [
+        [ok_response],
+    ]
+
+    with mock_hedera_servers(response_sequences) as client:
+        transaction = PrngTransaction().set_range(1000)
+
+        response = transaction.submit(client)
+
+        assert response.transaction_id == transaction.transaction_id
+        assert response.transaction is transaction
+
+
+def test_prefetch_receipt_returns_prefetched_receipt(ok_response, receipt_query_response):
+    """Test that a prefetched receipt is queried in the background and returned by get_receipt."""
+    response_sequences = [
+        [ok_response, receipt_query_response],
+    ]
+
+    with mock_hedera_servers(response_sequences) as client:
+        transaction = PrngTransaction().set_range(1000)
+
+        response = transaction.submit(client)
+        assert response.prefetch_receipt(client) is response
+
+        prefetched = response._receipt_future.result(timeout=10)
+
+        # The receipt is not queried again; only one receipt response is available
+        assert response.get_receipt(client) is prefetched
+        assert prefetched.status == ResponseCode.SUCCESS, "Transaction should have succeeded"